@@ -0,0 +1,80 @@
+"""Batch execution of multiple pipeline runs."""
+
+import os
+import shutil
+from concurrent.futures import ProcessPoolExecutor
+
+from soundweave.config import PipelineConfig
+from soundweave.utils.validators import ValidationError, estimate_and_validate
+
+
+def _run_one(config: PipelineConfig) -> int:
+    """Run a single pipeline in a worker process.
+
+    Module-level so ProcessPoolExecutor can pickle it.
+
+    Args:
+        config: Pipeline configuration for this run
+
+    Returns:
+        Pipeline exit code
+    """
+    from soundweave.pipeline import Pipeline
+
+    return Pipeline(config).run()
+
+
+def run_batch(
+    configs: list[PipelineConfig],
+    max_workers: int | None = None
+) -> list[int]:
+    """Run several pipelines in parallel worker processes.
+
+    One process per run keeps the ffmpeg invocations of independent albums
+    on separate cores; runs with distinct output directories share nothing,
+    so throughput scales until the disks saturate. ffmpeg itself has no
+    daemon mode, so cold-start cost is amortized by overlapping runs rather
+    than by keeping encoder processes warm.
+
+    Args:
+        configs: One configuration per run; output directories must be
+            distinct
+        max_workers: Worker process count (default: half the cores, so each
+            run keeps headroom for its own ffmpeg threads)
+
+    Returns:
+        Exit codes, in the order of ``configs``
+
+    Raises:
+        ValidationError: If output directories collide or combined disk
+            space is insufficient
+    """
+    if not configs:
+        return []
+
+    output_dirs = [c.output_dir for c in configs]
+    if len(set(output_dirs)) != len(output_dirs):
+        raise ValidationError("Batch runs must use distinct output directories")
+
+    # Per-run validation, plus a combined check: individually fitting runs
+    # can still exceed the disk together. (The combined check assumes the
+    # output directories share a filesystem, the common batch layout.)
+    total_needed = sum(
+        estimate_and_validate(c.input_dir, c.output_dir) for c in configs
+    )
+    try:
+        target = output_dirs[0] if output_dirs[0].exists() else output_dirs[0].parent
+        free = shutil.disk_usage(target).free
+    except OSError:
+        free = None  # Can't check: same policy as the per-run estimator
+    if free is not None and free < total_needed:
+        needed_gb = total_needed / (1024 ** 3)
+        free_gb = free / (1024 ** 3)
+        raise ValidationError(
+            f"Insufficient disk space for batch: need ~{needed_gb:.1f}GB "
+            f"across {len(configs)} run(s), {free_gb:.1f}GB available"
+        )
+
+    workers = max_workers or max(1, (os.cpu_count() or 2) // 2)
+    with ProcessPoolExecutor(max_workers=min(workers, len(configs))) as executor:
+        return list(executor.map(_run_one, configs))
@@ -2,27 +2,20 @@
 
 import argparse
 import sys
+from functools import lru_cache
 from pathlib import Path
+from typing import TYPE_CHECKING
 
-from soundweave.config import PipelineConfig
-from soundweave.utils.validators import (
-    ValidationError,
-    estimate_disk_space_needed,
-    validate_asset_path,
-    validate_disk_space,
-    validate_ffmpeg,
-    validate_input_directory,
-    validate_output_directory,
-    validate_python_version,
-)
+# Heavy imports (config, validators, pipeline) are deferred into the
+# functions that need them so `--help` and argument errors only pay for
+# argparse itself.
+if TYPE_CHECKING:
+    from soundweave.config import PipelineConfig
 
 
-def parse_args() -> argparse.Namespace:
-    """Parse command-line arguments.
-
-    Returns:
-        Parsed arguments
-    """
+@lru_cache(maxsize=1)
+def _make_parser() -> argparse.ArgumentParser:
+    """Build the argument parser (once; repeated parse_args calls reuse it)."""
     parser = argparse.ArgumentParser(
         prog="soundweave",
         description="Random soundtrack selector and YouTube video generator",
@@ -83,10 +76,19 @@ Examples:
         help="Disable shuffling - keep original/natural order"
     )
 
-    return parser.parse_args()
+    return parser
 
 
-def build_config(args: argparse.Namespace) -> PipelineConfig:
+def parse_args() -> argparse.Namespace:
+    """Parse command-line arguments.
+
+    Returns:
+        Parsed arguments
+    """
+    return _make_parser().parse_args()
+
+
+def build_config(args: argparse.Namespace) -> "PipelineConfig":
     """Build PipelineConfig from parsed arguments.
 
     Args:
@@ -95,7 +97,10 @@ def build_config(args: argparse.Namespace) -> PipelineConfig:
     Returns:
         PipelineConfig instance
     """
-    return PipelineConfig(
+    from soundweave.config import PipelineConfig
+
+    # argparse already produced Path objects, so skip __post_init__ coercion
+    return PipelineConfig.from_trusted(
         input_dir=args.input,
         output_dir=args.output,
         static_image=args.image,
@@ -105,7 +110,7 @@ def build_config(args: argparse.Namespace) -> PipelineConfig:
     )
 
 
-def run_preflight_checks(config: PipelineConfig) -> None:
+def run_preflight_checks(config: "PipelineConfig") -> None:
     """Run all pre-flight validation checks.
 
     Args:
@@ -114,6 +119,15 @@ def run_preflight_checks(config: PipelineConfig) -> None:
     Raises:
         ValidationError: If any validation fails
     """
+    from soundweave.utils.validators import (
+        cached_ffmpeg_version,
+        estimate_and_validate,
+        validate_asset_path,
+        validate_input_directory,
+        validate_output_directory,
+        validate_python_version,
+    )
+
     print("Running pre-flight checks...")
 
     # Check Python version
@@ -121,7 +135,7 @@ def run_preflight_checks(config: PipelineConfig) -> None:
     print(f"✓ Python {sys.version_info.major}.{sys.version_info.minor}")
 
     # Check FFmpeg
-    ffmpeg_version = validate_ffmpeg()
+    ffmpeg_version = cached_ffmpeg_version()
     print(f"✓ FFmpeg {ffmpeg_version}")
 
     # Check input directory
@@ -137,9 +151,8 @@ def run_preflight_checks(config: PipelineConfig) -> None:
     if config.static_image:
         print(f"✓ Static image: {config.static_image}")
 
-    # Check disk space
-    needed_bytes = estimate_disk_space_needed(config.input_dir)
-    validate_disk_space(config.output_dir, needed_bytes)
+    # Check disk space (single scandir + disk_usage pass)
+    needed_bytes = estimate_and_validate(config.input_dir, config.output_dir)
     needed_gb = needed_bytes / (1024**3)
     print(f"✓ Estimated disk space needed: ~{needed_gb:.2f}GB")
 
@@ -152,8 +165,12 @@ def main() -> int:
     Returns:
         Exit code (0=success, 1=validation error, 2=processing error, 3=output error)
     """
+    # Parse first so --help and argument errors exit before any heavy imports
+    args = parse_args()
+
+    from soundweave.utils.validators import ValidationError
+
     try:
-        args = parse_args()
         config = build_config(args)
         run_preflight_checks(config)
 
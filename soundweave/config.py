@@ -1,17 +1,48 @@
 """Configuration dataclass for the Soundweave pipeline."""
 
 from dataclasses import dataclass, field
-from datetime import datetime, timezone
 from pathlib import Path
-from uuid import uuid4
 
 
-@dataclass
+def _as_path(value: Path | str | None) -> Path | None:
+    """Coerce str to Path; values that are already Path (or None) pass through.
+
+    The exact-type check on str is cheaper than an isinstance MRO walk for
+    the common case where callers already pass Path objects.
+    """
+    return Path(value) if type(value) is str else value
+
+
+def _resolve_order_file(input_dir: Path) -> Path | None:
+    """Return input_dir/order.txt if present, else None."""
+    order_file = input_dir / "order.txt"
+    return order_file if order_file.exists() else None
+
+
+def _default_run_id() -> str:
+    """Generate a fresh run ID (uuid import deferred to first use)."""
+    from uuid import uuid4
+
+    return str(uuid4())
+
+
+def _default_timestamp() -> str:
+    """Generate an ISO-8601 UTC timestamp (datetime import deferred to first use)."""
+    from datetime import datetime, timezone
+
+    return datetime.now(timezone.utc).isoformat()
+
+
+@dataclass(frozen=True, slots=True)
 class PipelineConfig:
     """Configuration for the entire pipeline run.
 
     This dataclass holds all parameters needed for processing,
     ensuring type safety and clear documentation of options.
+
+    Frozen and slotted: instances are immutable (safe to share across
+    stages and usable as cache keys) and attribute reads go through
+    fixed slot offsets instead of a per-instance __dict__.
     """
 
     # Required paths
@@ -25,18 +56,68 @@ class PipelineConfig:
     fade_ms: int = 3000                 # Crossfade duration in milliseconds (3 seconds)
     num_tracks: int | None = None       # Number of tracks to select (None = all tracks)
     shuffle: bool = True                # Whether to shuffle/randomize track selection
+    skip_loudnorm_if_clean: bool = True  # Hardlink a lone 48k/s16 stereo WAV instead of re-encoding
+
+    # Resolved once at construction: input_dir/order.txt if it exists,
+    # else None. Both ingest and the manifest need the same answer, so
+    # the stat happens exactly once per run.
+    order_file: Path | None = field(default=None, init=False)
 
-    # Generated at runtime (do not set manually)
-    run_id: str = field(default_factory=lambda: str(uuid4()))
-    timestamp: str = field(
-        default_factory=lambda: datetime.now(timezone.utc).isoformat()
-    )
+    # Generated lazily on first read (do not set manually). Deferring the
+    # uuid4/clock calls means failed pre-flight runs never pay for them.
+    # compare=False keeps them out of the generated __eq__/__hash__, so
+    # reading run_id doesn't change a config's hash or equality — identity
+    # stays the real parameters above.
+    _run_id: str | None = field(default=None, init=False, repr=False, compare=False)
+    _timestamp: str | None = field(default=None, init=False, repr=False, compare=False)
+
+    @property
+    def run_id(self) -> str:
+        """Unique ID for this run, generated on first access."""
+        if self._run_id is None:
+            object.__setattr__(self, "_run_id", _default_run_id())
+        return self._run_id
+
+    @property
+    def timestamp(self) -> str:
+        """ISO-8601 UTC timestamp for this run, generated on first access."""
+        if self._timestamp is None:
+            object.__setattr__(self, "_timestamp", _default_timestamp())
+        return self._timestamp
 
     def __post_init__(self):
         """Convert string paths to Path objects if needed."""
-        if isinstance(self.input_dir, str):
-            self.input_dir = Path(self.input_dir)
-        if isinstance(self.output_dir, str):
-            self.output_dir = Path(self.output_dir)
-        if isinstance(self.static_image, str):
-            self.static_image = Path(self.static_image)
+        # object.__setattr__ because the dataclass is frozen
+        object.__setattr__(self, "input_dir", _as_path(self.input_dir))
+        object.__setattr__(self, "output_dir", _as_path(self.output_dir))
+        object.__setattr__(self, "static_image", _as_path(self.static_image))
+        object.__setattr__(self, "order_file", _resolve_order_file(self.input_dir))
+
+    @classmethod
+    def from_trusted(
+        cls,
+        input_dir: Path,
+        output_dir: Path,
+        static_image: Path | None = None,
+        fade_ms: int = 3000,
+        num_tracks: int | None = None,
+        shuffle: bool = True,
+        skip_loudnorm_if_clean: bool = True,
+    ) -> "PipelineConfig":
+        """Fast-path constructor for callers that already hold Path objects.
+
+        Skips the __post_init__ coercion entirely. The CLI qualifies because
+        argparse parses path arguments with type=Path.
+        """
+        obj = cls.__new__(cls)
+        object.__setattr__(obj, "input_dir", input_dir)
+        object.__setattr__(obj, "output_dir", output_dir)
+        object.__setattr__(obj, "static_image", static_image)
+        object.__setattr__(obj, "fade_ms", fade_ms)
+        object.__setattr__(obj, "num_tracks", num_tracks)
+        object.__setattr__(obj, "shuffle", shuffle)
+        object.__setattr__(obj, "skip_loudnorm_if_clean", skip_loudnorm_if_clean)
+        object.__setattr__(obj, "order_file", _resolve_order_file(input_dir))
+        object.__setattr__(obj, "_run_id", None)
+        object.__setattr__(obj, "_timestamp", None)
+        return obj
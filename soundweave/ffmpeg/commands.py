@@ -1,14 +1,160 @@
 """FFmpeg command builders for each pipeline stage."""
 
+import os
+import sys
+from functools import lru_cache
 from pathlib import Path
 
 from soundweave.stages.ingest import AudioTrack
 
+# Shared argv fragments, interned once at import so every built command
+# reuses the same string objects instead of allocating new ones per call.
+_AR_48K = (sys.intern("-ar"), sys.intern("48000"))        # Resample to 48kHz
+_AC_STEREO = (sys.intern("-ac"), sys.intern("2"))         # Stereo
+_S16 = (sys.intern("-sample_fmt"), sys.intern("s16"))     # 16-bit PCM
+_OVERWRITE = (sys.intern("-y"),)                          # Overwrite output
+_INPUT = sys.intern("-i")
+
+# FFmpeg's defaults run filter_complex graphs single-threaded; request all
+# cores explicitly so loudnorm/acrossfade chains and encoders scale out.
+_NCPU = str(os.cpu_count() or 2)
+THREAD_FLAGS = (
+    "-threads", "0",
+    "-filter_threads", _NCPU,
+    "-filter_complex_threads", _NCPU,
+)
+
+# Above this size the filter graph goes into a script file next to the
+# output instead of argv, keeping large playlists clear of ARG_MAX.
+_FILTER_SCRIPT_THRESHOLD = 8192
+
+# Per-track pre-processing: trim trailing silence. Hoisted so the loop
+# below doesn't re-format the constant part per track.
+SILENCE_FILTER = "silenceremove=stop_periods=1:stop_duration=0.5:stop_threshold=-50dB"
+
+# EBU R128 normalization to -20 LUFS; run once on the merged stream rather
+# than per track (the gating+histogram analysis is the expensive part).
+LOUDNORM_FILTER = "loudnorm=I=-20:TP=-1.5:LRA=11"
+
+# Trim + normalize chain, used where a single track is processed standalone
+# (e.g. the loudness measurement pass in utils/loudnorm_cache.py).
+NORMALIZE_FILTER = SILENCE_FILTER + "," + LOUDNORM_FILTER
+
+# Integrated loudness target in LUFS, kept in sync with LOUDNORM_FILTER
+_TARGET_I = -20.0
+
+# Constant argv tails, built once at import instead of per call
+_MP3_ENCODE_ARGS = ("-codec:a", "libmp3lame", "-b:a", "320k")
+
+
+def _normalize_filter_for(measured: tuple[str, ...] | None) -> str:
+    """Per-track pre-processing filter: silence trim plus gain alignment.
+
+    When a cached loudness measurement exists, a plain volume gain brings
+    the track to the -20 LUFS target before crossfading, so transitions are
+    level-matched without paying an EBU R128 analysis per track; the final
+    single loudnorm pass then polishes the merged stream.
+    """
+    if measured is None:
+        return SILENCE_FILTER
+    gain_db = _TARGET_I - float(measured[0])
+    return "".join((SILENCE_FILTER, ",volume=", f"{gain_db:.2f}", "dB"))
+
+
+@lru_cache(maxsize=32)
+def _build_merge_filter(
+    n_tracks: int,
+    crossfade_durations: tuple[float, ...],
+    measured: tuple[tuple[str, ...] | None, ...] | None = None,
+) -> tuple[str, str]:
+    """Build the crossfade filter_complex for n_tracks inputs.
+
+    Pure function of (track count, crossfade durations), memoized so batch
+    runs that rebuild commands with the same shape reuse the string.
+
+    Strategy:
+        1. Trim trailing silence per track (plus measured gain alignment)
+        2. Combine with acrossfade in a balanced tree reduction:
+           (t0⊕t1), (t2⊕t3), ... then pairs of pairs. Graph depth is
+           O(log N) instead of the old left-deep O(N) chain, so ffmpeg's
+           filter threads can work on sibling subtrees in parallel.
+        3. Run loudnorm once on the merged stream — O(1) EBU R128
+           analyses instead of one per track.
+
+    Each junction still uses the crossfade duration of the original track
+    boundary it joins (the last track of the left subtree), so the audible
+    result is identical to the sequential chain.
+
+    Args:
+        n_tracks: Number of input tracks
+        crossfade_durations: Crossfade duration (in seconds) between each pair
+        measured: Optional per-track loudness measurements (see
+            utils/loudnorm_cache.py); tracks with a measurement get a
+            volume gain aligning them to the -20 LUFS target before
+            crossfading
+
+    Returns:
+        (filter_complex string, final output label)
+    """
+    # Exactly n pre-processing parts, n-1 crossfade junctions, and one final
+    # loudnorm, so the list can be sized up front instead of growing through
+    # repeated reallocations.
+    filter_parts: list[str] = [""] * (2 * n_tracks)
+    part_idx = 0
+
+    # Step 1: Trim trailing silence (and align gain) for each input track.
+    # Built from joined fragments around the hoisted constant so the loop only
+    # formats the varying index, not the whole filter string.
+    for i in range(n_tracks):
+        idx = str(i)
+        normalize = _normalize_filter_for(measured[i] if measured else None)
+        filter_parts[part_idx] = "".join(("[", idx, ":a]", normalize, "[norm", idx, "]"))
+        part_idx += 1
+
+    # Step 2: Balanced tree of crossfades over the normalized streams.
+    # Each node tracks (label, index of its last original track) so the
+    # junction duration can be looked up for any subtree boundary.
+    nodes = [(f"norm{i}", i) for i in range(n_tracks)]
+    level = 0
+
+    while len(nodes) > 1:
+        next_nodes = []
+
+        for i in range(0, len(nodes) - 1, 2):
+            left_label, left_last = nodes[i]
+            right_label, right_last = nodes[i + 1]
+            output_label = f"l{level}_{i // 2}"
+
+            # acrossfade filter: [input1][input2]acrossfade=d=duration:c1=tri:c2=tri[output]
+            # c1=tri, c2=tri gives smooth triangular crossfade curves
+            filter_parts[part_idx] = "".join((
+                "[", left_label, "][", right_label,
+                "]acrossfade=d=", str(crossfade_durations[left_last]),
+                ":c1=tri:c2=tri[", output_label, "]",
+            ))
+            part_idx += 1
+
+            next_nodes.append((output_label, right_last))
+
+        if len(nodes) % 2:
+            next_nodes.append(nodes[-1])
+
+        nodes = next_nodes
+        level += 1
+
+    # Step 3: Single loudness-normalization pass over the merged stream
+    filter_parts[part_idx] = "".join(("[", nodes[0][0], "]", LOUDNORM_FILTER, "[out]"))
+    part_idx += 1
+
+    return ";".join(filter_parts[:part_idx]), "out"
+
 
 def build_merge_command(
     tracks: list[AudioTrack],
     output_path: Path,
     crossfade_durations: list[float],
+    output_mp3: Path | None = None,
+    measured: tuple[tuple[str, ...] | None, ...] | None = None,
 ) -> list[str]:
     """Build FFmpeg command for merging tracks with crossfades.
 
@@ -16,6 +162,12 @@ def build_merge_command(
         tracks: List of audio tracks to merge
         output_path: Path for output WAV file
         crossfade_durations: Crossfade duration (in seconds) between each pair
+        measured: Optional per-track loudness measurements used to
+            gain-align tracks before crossfading (see _normalize_filter_for)
+        output_mp3: Optional path for a 320kbps MP3 encoded from the same
+            filter graph. Splitting the merged stream with asplit means the
+            multi-hour mix is decoded and crossfaded exactly once instead of
+            being re-read from the WAV for a second encode pass.
 
     Returns:
         FFmpeg command as list of arguments
@@ -23,114 +175,175 @@ def build_merge_command(
     FFmpeg approach:
         - Use acrossfade filter for smooth crossfading
         - Resample all inputs to 48kHz, 16-bit PCM
-        - Chain crossfades sequentially
+        - Combine crossfades in a balanced tree
+        - Optionally fan the final stream out to WAV + MP3 in one pass
     """
     if len(tracks) == 0:
         raise ValueError("Cannot merge zero tracks")
 
-    if len(tracks) == 1:
-        # Single track: normalize and convert to target format
+    if len(tracks) == 1 and output_mp3 is None:
+        # Single track, single output: normalize and convert to target format
         track = tracks[0]
-        return [
-            "ffmpeg",
-            "-i", str(track.path),
-            "-af", "silenceremove=stop_periods=1:stop_duration=0.5:stop_threshold=-50dB,loudnorm=I=-20:TP=-1.5:LRA=11",
-            "-ar", "48000",              # Resample to 48kHz
-            "-ac", "2",                  # Stereo
-            "-sample_fmt", "s16",        # 16-bit PCM
-            "-y",                        # Overwrite output
-            str(output_path)
+        normalize = _normalize_filter_for(measured[0] if measured else None)
+        cmd = [
+            "ffmpeg", *THREAD_FLAGS, _INPUT, track.path_str,
+            "-af", normalize + "," + LOUDNORM_FILTER,
         ]
+        cmd.extend(_AR_48K)
+        cmd.extend(_AC_STEREO)
+        cmd.extend(_S16)
+        cmd.extend(_OVERWRITE)
+        cmd.append(str(output_path))
+        return cmd
 
-    # Multiple tracks: build crossfade filter chain
-    cmd = ["ffmpeg"]
+    # -y is a global option; keep it up front so it covers both outputs
+    cmd = ["ffmpeg", *THREAD_FLAGS, *_OVERWRITE]
 
     # Add all input files
     for track in tracks:
-        cmd.extend(["-i", str(track.path)])
-
-    # Build filter_complex for crossfading
-    # Strategy:
-    # 1. Normalize loudness of each track to -20 LUFS
-    # 2. Chain acrossfade filters
-    # [0:a]loudnorm[norm0]; [1:a]loudnorm[norm1]; [norm0][norm1]acrossfade[a1]; ...
+        cmd.append(_INPUT)
+        cmd.append(track.path_str)
 
-    filter_parts = []
+    if len(tracks) == 1:
+        normalize = _normalize_filter_for(measured[0] if measured else None)
+        filter_complex = "".join(("[0:a]", normalize, ",", LOUDNORM_FILTER, "[final]"))
+        current_label = "final"
+    else:
+        # The filter graph depends only on track count, crossfade durations,
+        # and loudness measurements, so batch runs sharing one config reuse
+        # the memoized string.
+        filter_complex, current_label = _build_merge_filter(
+            len(tracks), tuple(crossfade_durations), measured
+        )
 
-    # Step 1: Trim trailing silence and normalize loudness for each input track
-    for i in range(len(tracks)):
-        filter_parts.append(
-            f"[{i}:a]silenceremove=stop_periods=1:stop_duration=0.5:stop_threshold=-50dB,loudnorm=I=-20:TP=-1.5:LRA=11[norm{i}]"
+    if output_mp3 is not None:
+        # Fan the merged stream out so WAV and MP3 encode from one pass
+        filter_complex = "".join(
+            (filter_complex, ";[", current_label, "]asplit=2[outwav][outmp3]")
         )
 
-    # Step 2: Chain crossfades using normalized streams
-    current_label = "norm0"
+    # Add filter_complex. Very long graphs (hundreds of tracks) would blow
+    # past the kernel's ARG_MAX via execve, so spill them to a script file
+    # beside the output; merge_stage removes it after the run.
+    if len(filter_complex) > _FILTER_SCRIPT_THRESHOLD:
+        script_path = output_path.with_name("_filter_complex.txt")
+        script_path.write_text(filter_complex, encoding="utf-8")
+        cmd.extend(["-filter_complex_script", str(script_path)])
+    else:
+        cmd.extend(["-filter_complex", filter_complex])
 
-    for i in range(len(tracks) - 1):
-        next_input = f"norm{i + 1}"
-        crossfade_s = crossfade_durations[i]
-        output_label = f"a{i + 1}"
+    # Map the WAV output and set format
+    wav_label = "outwav" if output_mp3 is not None else current_label
+    cmd.extend(("-map", f"[{wav_label}]"))  # Map final crossfaded audio
+    cmd.extend(_AR_48K)
+    cmd.extend(_AC_STEREO)
+    cmd.extend(_S16)
+    cmd.append(str(output_path))
 
-        # acrossfade filter: [input1][input2]acrossfade=d=duration:c1=tri:c2=tri[output]
-        # c1=tri, c2=tri gives smooth triangular crossfade curves
-        filter_parts.append(
-            f"[{current_label}][{next_input}]acrossfade=d={crossfade_s}:c1=tri:c2=tri[{output_label}]"
-        )
+    if output_mp3 is not None:
+        # Second output: 320kbps CBR MP3 from the same filtered stream
+        cmd.extend(("-map", "[outmp3]", *_MP3_ENCODE_ARGS))
+        cmd.extend(_AR_48K)
+        cmd.extend(_AC_STEREO)
+        cmd.append(str(output_mp3))
 
-        current_label = output_label
+    return cmd
 
-    filter_complex = ";".join(filter_parts)
 
-    # Add filter_complex
-    cmd.extend(["-filter_complex", filter_complex])
+def build_mp3_command(input_path: Path, output_mp3: Path) -> list[str]:
+    """Build FFmpeg command for a standalone 320kbps CBR MP3 encode.
 
-    # Map the final output and set format
-    cmd.extend([
-        "-map", f"[{current_label}]",  # Map final crossfaded audio
-        "-ar", "48000",                 # 48kHz
-        "-ac", "2",                     # Stereo
-        "-sample_fmt", "s16",           # 16-bit PCM
-        "-y",                           # Overwrite
-        str(output_path)
-    ])
+    Args:
+        input_path: Path to source audio (WAV)
+        output_mp3: Path for output MP3
 
+    Returns:
+        FFmpeg command as list of arguments
+    """
+    cmd = [
+        "ffmpeg", *THREAD_FLAGS, *_OVERWRITE, _INPUT, str(input_path),
+        *_MP3_ENCODE_ARGS,
+    ]
+    cmd.extend(_AR_48K)
+    cmd.extend(_AC_STEREO)
+    cmd.append(str(output_mp3))
     return cmd
 
 
-def build_mp3_command(
-    input_wav: Path,
-    output_mp3: Path
+# Scale/pad the cover to 1920x1080, preserving aspect ratio (letterbox)
+VIDEO_SCALE_FILTER = (
+    "scale=1920:1080:force_original_aspect_ratio=decrease,"
+    "pad=1920:1080:(ow-iw)/2:(oh-ih)/2:black"
+)
+
+# Constant tail of the still-frame encode, shared across calls
+_STILL_FRAME_ARGS = (
+    "-pix_fmt", "yuv420p",           # Pixel format for compatibility
+    "-profile:v", "high",            # H.264 profile
+    "-r", "1",                       # 1 frame per second timebase
+    "-frames:v", "1",                # Encode exactly one frame
+    "-vf", VIDEO_SCALE_FILTER,       # Video filter for scaling/padding
+    "-y",                            # Overwrite output
+)
+
+# Constant middle of the mux command: copy video, map both streams
+_VIDEO_MUX_ARGS = (
+    "-map", "0:v",
+    "-map", "1:a",
+    "-c:v", "copy",                  # No re-encode: duplicate the NAL per tick
+)
+
+
+def build_still_frame_command(
+    cover_image: Path,
+    keyframe_path: Path
 ) -> list[str]:
-    """Build FFmpeg command for encoding WAV to MP3.
+    """Build FFmpeg command that encodes the cover image as a single H.264 frame.
+
+    Encoding the frame exactly once (instead of re-encoding the identical
+    image for every second of a multi-hour video) turns the video stage from
+    encode-bound into mux-bound; build_video_mux_command then duplicates the
+    encoded packet via stream copy.
 
     Args:
-        input_wav: Path to input WAV file
-        output_mp3: Path for output MP3 file
+        cover_image: Path to cover image
+        keyframe_path: Path for the intermediate single-frame MP4
 
     Returns:
         FFmpeg command as list of arguments
     """
-    return [
+    from soundweave.ffmpeg.encoders import detect_h264_encoder, encoder_args
+
+    cmd = [
         "ffmpeg",
-        "-i", str(input_wav),
-        "-codec:a", "libmp3lame",
-        "-b:a", "320k",          # 320kbps CBR
-        "-y",
-        str(output_mp3)
+        *THREAD_FLAGS,
+        "-i", str(cover_image),
     ]
+    # H.264 codec: NVENC/VideoToolbox when the local build supports it,
+    # otherwise the historical libx264 settings
+    cmd.extend(encoder_args(detect_h264_encoder()))
+    cmd.extend(_STILL_FRAME_ARGS)
+    cmd.append(str(keyframe_path))
+    return cmd
 
 
-def build_video_command(
+def build_video_mux_command(
+    keyframe_path: Path,
     audio_path: Path,
-    cover_image: Path,
     output_path: Path,
     duration_s: float
 ) -> list[str]:
-    """Build FFmpeg command for rendering static video.
+    """Build FFmpeg command that loops the encoded keyframe over the audio.
+
+    The video stream is stream-copied (-c:v copy) from the single-frame MP4,
+    so no H.264 encoding happens here regardless of audio length. MP3 audio
+    is stream-copied too (MP4 carries MP3 natively), so muxing the already
+    encoded merged.mp3 skips a full AAC re-encode of the mix; WAV input
+    still gets an AAC encode.
 
     Args:
-        audio_path: Path to final audio (merged.wav or merged.mp3)
-        cover_image: Path to cover image
+        keyframe_path: Path to single-frame MP4 from build_still_frame_command
+        audio_path: Path to final audio (merged.mp3 preferred, or merged.wav)
         output_path: Path for output MP4
         duration_s: Audio duration in seconds
 
@@ -138,29 +351,23 @@ def build_video_command(
         FFmpeg command as list of arguments
 
     Output format:
-        - 1920x1080 (scale/pad, preserve aspect ratio)
-        - 1fps (static image)
-        - H.264 (yuv420p, high profile)
-        - AAC audio (192kbps)
+        - 1920x1080, 1fps (copied keyframe)
+        - Copied MP3 audio (or AAC 192kbps from WAV input)
+        - Duration matches audio exactly
     """
+    if audio_path.suffix == ".mp3":
+        audio_args = ("-c:a", "copy")    # Reuse the merge stage's encode
+    else:
+        audio_args = ("-c:a", "aac", "-b:a", "192k")
+
     return [
         "ffmpeg",
-        "-loop", "1",                    # Loop image
-        "-i", str(cover_image),
+        *THREAD_FLAGS,
+        "-stream_loop", "-1",            # Repeat the single frame indefinitely
+        "-i", str(keyframe_path),
         "-i", str(audio_path),
-        "-c:v", "libx264",               # H.264 codec
-        "-preset", "medium",             # Encoding preset
-        "-tune", "stillimage",           # Optimize for static image
-        "-crf", "18",                    # Quality (lower = better, 18 is visually lossless)
-        "-pix_fmt", "yuv420p",           # Pixel format for compatibility
-        "-profile:v", "high",            # H.264 profile
-        "-r", "1",                       # 1 frame per second
-        "-vf", (                         # Video filter for scaling/padding
-            "scale=1920:1080:force_original_aspect_ratio=decrease,"
-            "pad=1920:1080:(ow-iw)/2:(oh-ih)/2:black"
-        ),
-        "-c:a", "aac",                   # AAC audio codec
-        "-b:a", "192k",                  # Audio bitrate
+        *_VIDEO_MUX_ARGS,
+        *audio_args,
         "-shortest",                     # Stop when shortest input ends
         "-t", str(duration_s),           # Explicit duration
         "-y",                            # Overwrite output
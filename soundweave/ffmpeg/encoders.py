@@ -0,0 +1,121 @@
+"""H.264 encoder detection for video rendering.
+
+Probes the local FFmpeg build once for hardware H.264 encoders and falls
+back to libx264. Detection is cached in-process and on disk (keyed by the
+ffmpeg binary path and mtime, same scheme as the version cache) so repeat
+runs never re-spawn `ffmpeg -encoders`.
+"""
+
+import json
+import os
+import re
+import shutil
+import subprocess
+from pathlib import Path
+
+from soundweave.utils.fs import cache_disabled, write_json_atomic
+
+_ENCODER_CACHE_FILE = Path.home() / ".cache" / "soundweave" / "encoders.json"
+
+# Preference order for hardware encoders. h264_vaapi is deliberately not
+# auto-selected: it needs a -vaapi_device and hwupload filter plumbing that
+# the video command builders do not set up.
+_HW_ENCODERS = ("h264_nvenc", "h264_videotoolbox")
+
+SOFTWARE_ENCODER = "libx264"
+
+# In-process cache (None = not yet detected)
+_detected_encoder: str | None = None
+
+
+def _probe_encoders() -> str:
+    """Run `ffmpeg -encoders` and pick the best available H.264 encoder."""
+    try:
+        result = subprocess.run(
+            ["ffmpeg", "-hide_banner", "-encoders"],
+            capture_output=True,
+            text=True,
+            timeout=5
+        )
+    except (OSError, subprocess.TimeoutExpired):
+        return SOFTWARE_ENCODER
+
+    if result.returncode != 0:
+        return SOFTWARE_ENCODER
+
+    # Encoder lines look like " V....D h264_nvenc  NVIDIA NVENC H.264 encoder"
+    available = set(re.findall(r"^\s*V\S*\s+(\S+)", result.stdout, re.MULTILINE))
+
+    for encoder in _HW_ENCODERS:
+        if encoder in available:
+            return encoder
+
+    return SOFTWARE_ENCODER
+
+
+def detect_h264_encoder() -> str:
+    """Return the H.264 encoder to use, detecting hardware support once.
+
+    The result is cached in a module global for the process lifetime and in
+    ~/.cache/soundweave/encoders.json across runs (invalidated when the
+    ffmpeg binary changes). Set SOUNDWEAVE_NO_CACHE=1 to force re-detection.
+
+    Returns:
+        Encoder name (h264_nvenc, h264_videotoolbox, or libx264)
+    """
+    global _detected_encoder
+
+    if _detected_encoder is not None:
+        return _detected_encoder
+
+    ffmpeg_path = shutil.which("ffmpeg")
+    if ffmpeg_path is None:
+        # Command construction shouldn't fail here; execution will surface
+        # the missing binary with a proper error.
+        return SOFTWARE_ENCODER
+
+    mtime_ns = None
+    if not cache_disabled():
+        try:
+            mtime_ns = os.stat(ffmpeg_path).st_mtime_ns
+            cached = json.loads(_ENCODER_CACHE_FILE.read_text(encoding="utf-8"))
+            if cached.get("path") == ffmpeg_path and cached.get("mtime_ns") == mtime_ns:
+                _detected_encoder = cached["encoder"]
+                return _detected_encoder
+        except (OSError, ValueError, KeyError):
+            pass  # Missing/corrupt cache: fall through to probing
+
+    encoder = _probe_encoders()
+
+    if mtime_ns is not None:
+        write_json_atomic(
+            _ENCODER_CACHE_FILE,
+            {"path": ffmpeg_path, "mtime_ns": mtime_ns, "encoder": encoder}
+        )
+
+    _detected_encoder = encoder
+    return encoder
+
+
+def encoder_args(encoder: str) -> list[str]:
+    """Return the codec/quality argv fragment for the given encoder.
+
+    Args:
+        encoder: Encoder name from detect_h264_encoder()
+
+    Returns:
+        List of ffmpeg arguments selecting the encoder and its rate control
+    """
+    if encoder == "h264_nvenc":
+        # Constant-QP on the NVENC ASIC; p4 balances speed and quality
+        return ["-c:v", "h264_nvenc", "-preset", "p4", "-tune", "ll",
+                "-rc", "constqp", "-qp", "18"]
+
+    if encoder == "h264_videotoolbox":
+        return ["-c:v", "h264_videotoolbox", "-q:v", "65"]
+
+    # Software fallback: every frame a keyframe, no B-frames and a single
+    # reference, so x264 skips motion estimation entirely for the static cover
+    return ["-c:v", "libx264", "-preset", "medium", "-crf", "18",
+            "-x264-params", "keyint=1:min-keyint=1:scenecut=0:no-deblock=1",
+            "-bf", "0", "-refs", "1"]
@@ -30,15 +30,24 @@ def run_ffmpeg(
     Raises:
         ProcessingError: If FFmpeg returns non-zero exit code
     """
-    # Log the command being run
-    logger.debug(f"Running FFmpeg: {description}")
-    logger.debug(f"Command: {' '.join(command)}")
+    # Log the command being run; the guard skips the argv join entirely
+    # when debug records wouldn't be kept
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug("Running FFmpeg: %s", description)
+        logger.debug("Command: %s", " ".join(command))
+
+    # No caller parses progress lines, so suppress the per-second stats
+    # spam; real warnings/errors still arrive on stderr for the log
+    command = [command[0], "-hide_banner", "-nostats", *command[1:]]
 
     try:
+        # Bytes mode: nothing downstream needs full decoded text, so skip
+        # the locale decode of the whole stderr and decode only the slices
+        # that actually get logged
         result = subprocess.run(
             command,
             capture_output=True,
-            text=True,
+            bufsize=1 << 20,  # 1 MiB reads: drain stderr in few syscalls
             timeout=timeout
         )
 
@@ -46,15 +55,19 @@ def run_ffmpeg(
         if result.returncode != 0:
             logger.error(f"FFmpeg failed: {description}")
             logger.error(f"Exit code: {result.returncode}")
-            logger.error(f"stderr: {result.stderr}")
+            logger.error(f"stderr: {result.stderr.decode('utf-8', errors='replace')}")
             raise ProcessingError(f"FFmpeg failed: {description}")
 
         # Log success
-        logger.debug(f"FFmpeg succeeded: {description}")
+        logger.debug("FFmpeg succeeded: %s", description)
 
         # Log warnings from stderr (FFmpeg writes progress info to stderr)
         if result.stderr:
-            logger.debug(f"FFmpeg stderr: {result.stderr[:500]}")  # First 500 chars
+            # First 500 bytes, decoded only for the log line
+            logger.debug(
+                "FFmpeg stderr: %s",
+                result.stderr[:500].decode("utf-8", errors="replace")
+            )
 
         return result
 
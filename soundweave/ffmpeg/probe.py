@@ -1,14 +1,59 @@
 """FFprobe integration for audio metadata extraction."""
 
 import json
+import os
+import re
 import subprocess
-from dataclasses import dataclass
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import asdict, dataclass
 from pathlib import Path
 
+from soundweave.ffmpeg import probe_cache
 from soundweave.utils.validators import ValidationError
 
+# Optional fast JSON parse for ffprobe output; same pattern as the
+# manifest writer, stdlib fallback keeps the dependency optional
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
-@dataclass
+# Progress-feed key emitted by `-progress pipe:1`, e.g. "out_time_us=12345"
+_OUT_TIME_RE = re.compile(r"out_time_us=(\d+)")
+
+# silencedetect report line, e.g. "[silencedetect @ 0x...] silence_start: 123.456"
+_SILENCE_RE = re.compile(r"silence_start:\s*([\d.]+)")
+
+# Static argv segments, hoisted so each probe reuses the same interned
+# strings instead of rebuilding them per call
+_FFPROBE_BASE = ("ffprobe", "-v", "quiet")
+
+# Shallow mode: cap probesize/analyzeduration so common containers
+# (MP3/FLAC/WAV) are answered from the first header packets
+_FFPROBE_SHALLOW = ("-probesize", "32768", "-analyzeduration", "0")
+
+_FFPROBE_TAIL = (
+    "-select_streams", "a:0",  # Only the first audio stream: skips cover
+                               # art/subtitle/data streams, shrinks the JSON
+    "-print_format", "json",
+    # Only the fields _metadata_from_probe actually reads
+    "-show_entries",
+    "format=duration,bit_rate:stream=sample_rate,channels,codec_name,bit_rate",
+)
+
+_NULL_SINK = ("-f", "null", "-")
+
+_LOUDNORM_MEASURE_TAIL = (
+    "-af", "silenceremove=stop_periods=1:stop_duration=0.5:stop_threshold=-50dB,loudnorm=I=-20:TP=-1.5:LRA=11",
+    "-f", "null",
+    "-progress", "pipe:1",
+    "-nostats",
+    "-",
+)
+
+
+@dataclass(frozen=True, slots=True)
 class AudioMetadata:
     """Metadata extracted from an audio file."""
 
@@ -31,69 +76,55 @@ def probe_audio_file(file_path: Path) -> AudioMetadata:
     Raises:
         ValidationError: If file is corrupted or unsupported
     """
+    cached = probe_cache.load(file_path).get("metadata")
+    if cached is not None:
+        return AudioMetadata(**cached)
+
+    try:
+        metadata = _metadata_from_probe(_run_ffprobe(file_path, deep=False), file_path)
+    except ValidationError:
+        # The header-limited probe missed a required field (unusual
+        # container); retry once with ffprobe's full stream analysis
+        metadata = _metadata_from_probe(_run_ffprobe(file_path, deep=True), file_path)
+
+    probe_cache.store(file_path, metadata=asdict(metadata))
+    return metadata
+
+
+def _run_ffprobe(file_path: Path, deep: bool) -> dict:
+    """Run ffprobe on a file and return its parsed JSON output.
+
+    The default (shallow) mode caps probesize/analyzeduration so common
+    containers (MP3/FLAC/WAV) are answered from the first header packets
+    instead of a full stream scan; deep mode lifts the caps for files the
+    shallow probe couldn't describe.
+
+    Args:
+        file_path: Path to audio file
+        deep: Whether to run ffprobe's full stream analysis
+
+    Raises:
+        ValidationError: If ffprobe fails, times out, or emits bad JSON
+    """
+    caps = () if deep else _FFPROBE_SHALLOW
+    cmd = [*_FFPROBE_BASE, *caps, *_FFPROBE_TAIL, str(file_path)]
+
     try:
-        # Run ffprobe with JSON output
         result = subprocess.run(
-            [
-                "ffprobe",
-                "-v", "quiet",
-                "-print_format", "json",
-                "-show_format",
-                "-show_streams",
-                str(file_path)
-            ],
-            capture_output=True,
+            cmd,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,  # -v quiet already silences ffprobe
             text=True,
+            bufsize=1 << 20,  # 1 MiB reads: large JSON in few syscalls
             timeout=10
         )
 
         if result.returncode != 0:
             raise ValidationError(f"ffprobe failed for {file_path.name}")
 
-        # Parse JSON output
-        data = json.loads(result.stdout)
-
-        # Find the first audio stream
-        audio_stream = None
-        for stream in data.get("streams", []):
-            if stream.get("codec_type") == "audio":
-                audio_stream = stream
-                break
-
-        if not audio_stream:
-            raise ValidationError(f"No audio stream found in {file_path.name}")
-
-        # Extract metadata
-        format_info = data.get("format", {})
-
-        duration_s = float(format_info.get("duration", 0))
-        if duration_s <= 0:
-            raise ValidationError(f"Invalid duration for {file_path.name}")
-
-        sample_rate = int(audio_stream.get("sample_rate", 0))
-        if sample_rate <= 0:
-            raise ValidationError(f"Invalid sample rate for {file_path.name}")
-
-        channels = int(audio_stream.get("channels", 0))
-        if channels <= 0:
-            raise ValidationError(f"Invalid channel count for {file_path.name}")
-
-        codec = audio_stream.get("codec_name", "unknown")
-
-        # Bit rate may not always be available
-        bit_rate = None
-        if "bit_rate" in audio_stream:
-            bit_rate = int(audio_stream["bit_rate"])
-        elif "bit_rate" in format_info:
-            bit_rate = int(format_info["bit_rate"])
-
-        return AudioMetadata(
-            duration_s=duration_s,
-            sample_rate=sample_rate,
-            channels=channels,
-            codec=codec,
-            bit_rate=bit_rate
-        )
+        if orjson is not None:
+            return orjson.loads(result.stdout)
+        return json.loads(result.stdout)
 
     except FileNotFoundError:
         raise ValidationError("ffprobe not found. Please install FFmpeg.")
@@ -103,6 +134,89 @@ def probe_audio_file(file_path: Path) -> AudioMetadata:
         raise ValidationError(f"Failed to parse ffprobe output for {file_path.name}: {e}")
 
 
+def _metadata_from_probe(data: dict, file_path: Path) -> AudioMetadata:
+    """Build AudioMetadata from already-parsed ffprobe JSON.
+
+    Args:
+        data: Parsed ffprobe output (format + streams)
+        file_path: Probed file, for error messages
+
+    Raises:
+        ValidationError: If the probe data is missing or invalid
+    """
+    # ffprobe was scoped to the first audio stream via -select_streams, so
+    # the streams array holds at most one entry
+    streams = data.get("streams", [])
+    audio_stream = streams[0] if streams else None
+
+    if not audio_stream:
+        raise ValidationError(f"No audio stream found in {file_path.name}")
+
+    # Extract metadata
+    format_info = data.get("format", {})
+
+    duration_s = float(format_info.get("duration", 0))
+    if duration_s <= 0:
+        raise ValidationError(f"Invalid duration for {file_path.name}")
+
+    sample_rate = int(audio_stream.get("sample_rate", 0))
+    if sample_rate <= 0:
+        raise ValidationError(f"Invalid sample rate for {file_path.name}")
+
+    channels = int(audio_stream.get("channels", 0))
+    if channels <= 0:
+        raise ValidationError(f"Invalid channel count for {file_path.name}")
+
+    codec = audio_stream.get("codec_name", "unknown")
+
+    # Bit rate may not always be available
+    bit_rate = None
+    if "bit_rate" in audio_stream:
+        bit_rate = int(audio_stream["bit_rate"])
+    elif "bit_rate" in format_info:
+        bit_rate = int(format_info["bit_rate"])
+
+    return AudioMetadata(
+        duration_s=duration_s,
+        sample_rate=sample_rate,
+        channels=channels,
+        codec=codec,
+        bit_rate=bit_rate
+    )
+
+
+def probe_audio_files(
+    paths: list[Path],
+    max_workers: int | None = None
+) -> list[AudioMetadata | ValidationError]:
+    """Probe many audio files concurrently.
+
+    ffprobe cost is dominated by process spawn latency, so a thread pool of
+    concurrent spawns turns N serial probes into roughly max(single probe).
+
+    Args:
+        paths: Audio files to probe, in order
+        max_workers: Pool size (default: min(len(paths), cpu count))
+
+    Returns:
+        One entry per input path, in order: AudioMetadata on success or the
+        ValidationError describing why that file failed (not raised, so one
+        corrupted file doesn't abort the batch).
+    """
+    if not paths:
+        return []
+
+    def probe_one(path: Path) -> AudioMetadata | ValidationError:
+        try:
+            return probe_audio_file(path)
+        except ValidationError as e:
+            return e
+
+    workers = max_workers or min(len(paths), os.cpu_count() or 2)
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        return list(executor.map(probe_one, paths))
+
+
 def probe_loudnorm_duration(file_path: Path) -> float:
     """Measure the actual output duration after applying silence trim and loudnorm.
 
@@ -119,36 +233,43 @@ def probe_loudnorm_duration(file_path: Path) -> float:
     Raises:
         ValidationError: If FFmpeg fails or output cannot be parsed
     """
+    cached = probe_cache.load(file_path).get("loudnorm_duration_s")
+    if cached is not None:
+        return cached
+
     try:
-        # Output to raw PCM and count bytes to calculate duration
-        # This is reliable because we know the exact output format
-        # 48kHz, stereo (2 channels), 16-bit (2 bytes per sample)
-        # Duration = total_bytes / (48000 * 2 * 2)
+        # Decode to the null muxer and read the final out_time_us from the
+        # machine-readable progress feed. Only a few hundred bytes of
+        # key=value lines cross the pipe, instead of the full decoded PCM
+        # stream (~192 kB per second of audio) just to count its length.
         result = subprocess.run(
             [
                 "ffmpeg",
+                "-threads", "1",  # One core per track: the parallel wrapper
+                                  # below owns the fan-out across files
                 "-i", str(file_path),
-                "-af", "silenceremove=stop_periods=1:stop_duration=0.5:stop_threshold=-50dB,loudnorm=I=-20:TP=-1.5:LRA=11",
-                "-ar", "48000",
-                "-ac", "2",
-                "-f", "s16le",
-                "-"
+                *_LOUDNORM_MEASURE_TAIL,
             ],
             capture_output=True,
+            text=True,
             timeout=120  # Allow up to 2 minutes per track
         )
 
         if result.returncode != 0:
             raise ValidationError(
-                f"FFmpeg failed for {file_path.name}: {result.stderr.decode()[:200]}"
+                f"FFmpeg failed for {file_path.name}: {result.stderr[:200]}"
             )
 
-        # Calculate duration from raw PCM bytes
-        # 48000 samples/sec * 2 channels * 2 bytes/sample = 192000 bytes/sec
-        bytes_per_second = 48000 * 2 * 2
-        total_bytes = len(result.stdout)
-        duration_s = total_bytes / bytes_per_second
+        # The progress feed repeats out_time_us as decoding advances; the
+        # last value is the post-filter stream duration in microseconds
+        matches = _OUT_TIME_RE.findall(result.stdout)
+        if not matches:
+            raise ValidationError(
+                f"Could not parse processed duration for {file_path.name}"
+            )
+        duration_s = int(matches[-1]) / 1_000_000
 
+        probe_cache.store(file_path, loudnorm_duration_s=duration_s)
         return duration_s
 
     except subprocess.TimeoutExpired:
@@ -157,6 +278,40 @@ def probe_loudnorm_duration(file_path: Path) -> float:
         raise ValidationError("FFmpeg not found. Please install FFmpeg.")
 
 
+def probe_loudnorm_durations(
+    paths: list[Path],
+    max_workers: int | None = None
+) -> list[float | ValidationError]:
+    """Measure post-loudnorm durations for many files concurrently.
+
+    Each measurement is a single-threaded ffmpeg decode (minutes of CPU for
+    long tracks) and the files are independent, so fanning out across cores
+    divides the wall time near-linearly. Cached results return immediately.
+
+    Args:
+        paths: Audio files to measure, in order
+        max_workers: Pool size (default: half the cores, leaving headroom
+            for the decoders themselves)
+
+    Returns:
+        One entry per input path, in order: the duration on success or the
+        ValidationError describing the failure (not raised, so one bad file
+        doesn't abort the batch).
+    """
+    if not paths:
+        return []
+
+    def measure_one(path: Path) -> float | ValidationError:
+        try:
+            return probe_loudnorm_duration(path)
+        except ValidationError as e:
+            return e
+
+    workers = max_workers or max(1, (os.cpu_count() or 2) // 2)
+    with ThreadPoolExecutor(max_workers=min(workers, len(paths))) as executor:
+        return list(executor.map(measure_one, paths))
+
+
 def detect_track_boundaries(
     file_path: Path,
     expected_tracks: int,
@@ -180,32 +335,55 @@ def detect_track_boundaries(
     Raises:
         ValidationError: If FFmpeg fails or detection doesn't match expected tracks
     """
-    import re
-
     try:
-        # Use silencedetect filter to find quiet moments (crossfade dips)
-        result = subprocess.run(
+        # Use silencedetect filter to find quiet moments (crossfade dips).
+        # stderr is consumed line by line as the decode progresses, so the
+        # hours-long runs this handles never buffer megabytes of progress
+        # spam in memory before parsing.
+        proc = subprocess.Popen(
             [
                 "ffmpeg",
+                "-nostats",
                 "-i", str(file_path),
                 "-af", f"silencedetect=noise={noise_db}dB:d={min_silence_duration}",
-                "-f", "null",
-                "-"
+                *_NULL_SINK,
             ],
-            capture_output=True,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.PIPE,
             text=True,
-            timeout=600  # Allow up to 10 minutes for long files
+            bufsize=1
         )
 
-        # Parse silence_start timestamps from stderr
-        # Format: [silencedetect @ 0x...] silence_start: 123.456
-        silence_pattern = r"silence_start:\s*([\d.]+)"
-        silence_starts = re.findall(silence_pattern, result.stderr)
+        # Hard deadline on the whole read: the per-line loop has no timeout
+        # of its own, so an ffmpeg that stalls while holding stderr open
+        # would block forever. The watchdog kills the process, which EOFs
+        # stderr and unblocks the loop.
+        timed_out = threading.Event()
+
+        def _kill_on_deadline():
+            timed_out.set()
+            proc.kill()
 
-        # Convert to floats and add 0.0 for first track
+        watchdog = threading.Timer(600, _kill_on_deadline)  # 10 minutes
+        watchdog.start()
+
+        # Collect silence_start timestamps incrementally, with 0.0 for the
+        # first track
         timestamps = [0.0]
-        for ts in silence_starts:
-            timestamps.append(float(ts))
+        try:
+            for line in proc.stderr:
+                match = _SILENCE_RE.search(line)
+                if match:
+                    timestamps.append(float(match.group(1)))
+            proc.wait()
+        finally:
+            watchdog.cancel()
+            proc.stderr.close()
+
+        if timed_out.is_set():
+            raise ValidationError(
+                f"FFmpeg timed out detecting track boundaries in {file_path.name}"
+            )
 
         # If we got expected number of boundaries, return them
         if len(timestamps) == expected_tracks:
@@ -216,7 +394,5 @@ def detect_track_boundaries(
         # Return what we have with a warning (caller can decide what to do)
         return timestamps
 
-    except subprocess.TimeoutExpired:
-        raise ValidationError(f"FFmpeg timed out detecting track boundaries in {file_path.name}")
     except FileNotFoundError:
         raise ValidationError("FFmpeg not found. Please install FFmpeg.")
@@ -0,0 +1,76 @@
+"""On-disk cache of per-file probe results.
+
+Probing is redundant work on repeat runs: metadata and measured durations
+cannot change unless the file itself does. Entries live as one small JSON
+per source file under ~/.cache/soundweave/probe/, named by a hash of the
+resolved path and keyed by (mtime_ns, size) so any modification
+invalidates automatically. Set SOUNDWEAVE_NO_CACHE=1 to bypass.
+"""
+
+import hashlib
+import json
+import os
+from pathlib import Path
+
+from soundweave.utils.fs import cache_disabled, write_json_atomic
+
+_CACHE_DIR = Path.home() / ".cache" / "soundweave" / "probe"
+
+
+def _cache_path(file_path: Path) -> Path:
+    digest = hashlib.sha1(str(file_path.resolve()).encode("utf-8")).hexdigest()
+    return _CACHE_DIR / f"{digest}.json"
+
+
+def _current_key(file_path: Path) -> str | None:
+    """Cache key for the file as it exists now, or None if caching is off."""
+    if cache_disabled():
+        return None
+    try:
+        st = os.stat(file_path)
+    except OSError:
+        return None
+    return f"{st.st_mtime_ns}:{st.st_size}"
+
+
+def load(file_path: Path) -> dict:
+    """Return the cached entry for a file, or {} when absent or stale.
+
+    Args:
+        file_path: Source audio file
+
+    Returns:
+        The entry dict; individual results live under their own keys
+        (e.g. "metadata", "loudnorm_duration_s")
+    """
+    key = _current_key(file_path)
+    if key is None:
+        return {}
+    try:
+        entry = json.loads(_cache_path(file_path).read_text(encoding="utf-8"))
+        if entry.get("key") == key:
+            return entry
+    except (OSError, ValueError):
+        pass
+    return {}
+
+
+def store(file_path: Path, **fields) -> None:
+    """Merge result fields into the file's cache entry (best-effort).
+
+    Rewrites the entry atomically so concurrent runs never see a partial
+    file; failures are swallowed — the cache is an optimization only.
+
+    Args:
+        file_path: Source audio file
+        **fields: Results to record (e.g. metadata=..., loudnorm_duration_s=...)
+    """
+    key = _current_key(file_path)
+    if key is None:
+        return
+
+    entry = load(file_path)
+    entry.update(fields)
+    entry["key"] = key
+
+    write_json_atomic(_cache_path(file_path), entry)
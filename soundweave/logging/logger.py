@@ -1,14 +1,28 @@
 """Logging setup for human-readable run logs."""
 
+import atexit
 import logging
+import logging.handlers
+import queue
 import sys
 from pathlib import Path
 from typing import TextIO
 
 
+def _stop_listener(listener: logging.handlers.QueueListener) -> None:
+    """Stop a queue listener, tolerating an already-stopped one."""
+    if listener._thread is not None:
+        listener.stop()
+
+
 def setup_logger(log_file: Path) -> logging.Logger:
     """Setup logger that writes to console (INFO) and file (DEBUG).
 
+    File records go through a QueueHandler/QueueListener pair feeding a
+    MemoryHandler in front of the FileHandler, so the pipeline thread never
+    blocks on a write+flush syscall per record and small DEBUG writes are
+    coalesced into batches. Errors flush the buffer immediately.
+
     Args:
         log_file: Path to write log file
 
@@ -18,7 +32,10 @@ def setup_logger(log_file: Path) -> logging.Logger:
     logger = logging.getLogger("soundweave")
     logger.setLevel(logging.DEBUG)
 
-    # Remove any existing handlers
+    # Remove any existing handlers (and stop a listener from a previous setup)
+    previous_listener = getattr(logger, "_queue_listener", None)
+    if previous_listener is not None:
+        _stop_listener(previous_listener)
     logger.handlers.clear()
 
     # Console handler (INFO level)
@@ -29,7 +46,7 @@ def setup_logger(log_file: Path) -> logging.Logger:
     )
     console_handler.setFormatter(console_format)
 
-    # File handler (DEBUG level)
+    # File handler (DEBUG level), buffered and drained on a background thread
     log_file.parent.mkdir(parents=True, exist_ok=True)
     file_handler = logging.FileHandler(log_file, mode="w", encoding="utf-8")
     file_handler.setLevel(logging.DEBUG)
@@ -39,7 +56,23 @@ def setup_logger(log_file: Path) -> logging.Logger:
     )
     file_handler.setFormatter(file_format)
 
+    memory_handler = logging.handlers.MemoryHandler(
+        capacity=1000,
+        flushLevel=logging.ERROR,
+        target=file_handler
+    )
+
+    log_queue: queue.SimpleQueue = queue.SimpleQueue()
+    listener = logging.handlers.QueueListener(
+        log_queue, memory_handler, respect_handler_level=True
+    )
+    listener.start()
+    # Stop the listener at interpreter exit so buffered records reach disk;
+    # keep a reference on the logger so a re-setup can stop it earlier
+    atexit.register(_stop_listener, listener)
+    logger._queue_listener = listener
+
     logger.addHandler(console_handler)
-    logger.addHandler(file_handler)
+    logger.addHandler(logging.handlers.QueueHandler(log_queue))
 
     return logger
@@ -2,13 +2,47 @@
 
 import hashlib
 import json
+import os
 import platform
+import shlex
 import subprocess
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
+from functools import cache
 from pathlib import Path
 
 from soundweave.config import PipelineConfig
+from soundweave.utils.fs import file_mb
+
+# orjson serializes straight to bytes in C — several times faster than the
+# stdlib encoder on manifests with long ffmpeg_commands/stages arrays.
+# Optional: the stdlib path below produces equivalent output.
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+@cache
+def _ffmpeg_version() -> str:
+    """Get FFmpeg version string (one spawn per process, not per manifest)."""
+    env_version = os.environ.get("FFMPEG_VERSION")
+    if env_version:
+        return env_version
+
+    try:
+        result = subprocess.run(
+            ["ffmpeg", "-version"],
+            capture_output=True,
+            text=True,
+            timeout=5
+        )
+        # Extract first line (e.g., "ffmpeg version 4.4.2...")
+        first_line = result.stdout.split("\n")[0]
+        return first_line.replace("ffmpeg version ", "").split(" ")[0]
+    except Exception:
+        return "unknown"
 
 
 @dataclass
@@ -19,13 +53,29 @@ class ManifestBuilder:
     data: dict = field(default_factory=dict)
     ffmpeg_commands: list[str] = field(default_factory=list)
 
+    # Probe/hash results per path, so outputs registered under two names
+    # (or re-registered on error paths) are only processed once
+    _output_cache: dict = field(default_factory=dict, repr=False)
+
+    # Line-buffered JSONL sidecar recording events as they happen, so a
+    # crash mid-run still leaves a recoverable record on disk
+    _stream: object = field(default=None, repr=False)
+
     def __post_init__(self):
         """Initialize manifest structure."""
+        try:
+            self._stream = open(
+                self.config.output_dir / "manifest.partial.jsonl",
+                "w", encoding="utf-8", buffering=1
+            )
+        except OSError:
+            self._stream = None  # Sidecar is best-effort only
+
         self.data = {
             "run_id": self.config.run_id,
             "timestamp": self.config.timestamp,
             "python_version": f"{sys.version_info.major}.{sys.version_info.minor}.{sys.version_info.micro}",
-            "ffmpeg_version": self._get_ffmpeg_version(),
+            "ffmpeg_version": _ffmpeg_version(),
             "platform": platform.system(),
             "inputs": {},
             "parameters": self._build_parameters(),
@@ -36,20 +86,19 @@ class ManifestBuilder:
             "errors": []
         }
 
-    def _get_ffmpeg_version(self) -> str:
-        """Get FFmpeg version string."""
+    def _stream_event(self, kind: str, payload: dict):
+        """Append one event to the JSONL sidecar (best-effort).
+
+        The stream is line-buffered, so each event reaches the OS as soon
+        as it is recorded without a per-record fsync.
+        """
+        if self._stream is None:
+            return
         try:
-            result = subprocess.run(
-                ["ffmpeg", "-version"],
-                capture_output=True,
-                text=True,
-                timeout=5
-            )
-            # Extract first line (e.g., "ffmpeg version 4.4.2...")
-            first_line = result.stdout.split("\n")[0]
-            return first_line.replace("ffmpeg version ", "").split(" ")[0]
-        except Exception:
-            return "unknown"
+            json.dump({"event": kind, **payload}, self._stream)
+            self._stream.write("\n")
+        except (OSError, ValueError, TypeError):
+            pass  # Never let sidecar bookkeeping fail the pipeline
 
     def _build_parameters(self) -> dict:
         """Build parameters dict from config."""
@@ -89,30 +138,38 @@ class ManifestBuilder:
         else:
             self.data["inputs"][name] = None
 
-    def add_output(self, name: str, path: Path):
-        """Add output file to manifest with metadata.
+    def _build_output_data(self, path: Path, duration_s: float | None = None) -> dict:
+        """Probe and hash one output file (memoized per path).
 
         Args:
-            name: Output name (merged_clean, merged_lofi_wav, etc.)
             path: Path to output file
+            duration_s: Duration if the caller already knows it, skipping
+                the ffprobe spawn
+
+        Returns:
+            Output metadata dict for the manifest
         """
-        if not path.exists():
-            return
+        cached = self._output_cache.get(path)
+        if cached is not None:
+            return cached
 
-        file_size_mb = round(path.stat().st_size / (1024 ** 2), 2)
+        file_size_mb = round(file_mb(path), 2)
         sha256 = self._compute_sha256(path)
 
         # Try to get duration from probe if it's audio/video
-        duration_s = None
-        try:
-            from soundweave.ffmpeg.probe import probe_audio_file
-            metadata = probe_audio_file(path)
-            duration_s = round(metadata.duration_s, 2)
-        except Exception:
-            pass
+        if duration_s is not None:
+            duration_s = round(duration_s, 2)
+        else:
+            try:
+                from soundweave.ffmpeg.probe import probe_audio_file
+                metadata = probe_audio_file(path)
+                duration_s = round(metadata.duration_s, 2)
+            except Exception:
+                pass
 
         output_data = {
             "path": str(path),
+            "filename": path.name,
             "file_size_mb": file_size_mb,
             "sha256": sha256
         }
@@ -120,7 +177,55 @@ class ManifestBuilder:
         if duration_s:
             output_data["duration_s"] = duration_s
 
-        self.data["outputs"][name] = output_data
+        self._output_cache[path] = output_data
+        return output_data
+
+    def add_output(self, name: str, path: Path, *, duration_s: float | None = None):
+        """Add output file to manifest with metadata.
+
+        Args:
+            name: Output name (merged_clean, merged_mp3, etc.)
+            path: Path to output file
+            duration_s: Duration the caller already knows, if any (skips
+                the ffprobe spawn)
+        """
+        if not path.exists():
+            return
+
+        self.data["outputs"][name] = self._build_output_data(path, duration_s)
+        self._stream_event("output", {"name": name, **self.data["outputs"][name]})
+
+    def add_outputs(
+        self,
+        mapping: dict[str, Path],
+        durations: dict[str, float] | None = None
+    ):
+        """Add several output files, probing and hashing them in parallel.
+
+        ffprobe is subprocess-bound and SHA-256 releases the GIL inside
+        OpenSSL, so a small thread pool makes the manifest-finalisation cost
+        max(per-file) instead of the sum.
+
+        Args:
+            mapping: Output name → path (missing paths are skipped)
+            durations: Durations the caller already knows, by output name
+                (those entries skip their ffprobe spawn)
+        """
+        existing = {name: path for name, path in mapping.items() if path.exists()}
+        if not existing:
+            return
+
+        durations = durations or {}
+        with ThreadPoolExecutor(max_workers=min(8, len(existing))) as executor:
+            futures = {
+                name: executor.submit(
+                    self._build_output_data, path, durations.get(name)
+                )
+                for name, path in existing.items()
+            }
+            for name, future in futures.items():
+                self.data["outputs"][name] = future.result()
+                self._stream_event("output", {"name": name, **self.data["outputs"][name]})
 
     def add_stage_result(
         self,
@@ -144,14 +249,19 @@ class ManifestBuilder:
         }
         stage_data.update(extras)
         self.data["stages"].append(stage_data)
+        self._stream_event("stage", stage_data)
 
     def add_ffmpeg_command(self, command: list[str]):
         """Add FFmpeg command to manifest.
 
+        Serialized once at add time with shell quoting, so commands with
+        spaces in paths or filter strings can be copy-pasted from the
+        manifest straight into a shell.
+
         Args:
             command: FFmpeg command as list
         """
-        self.ffmpeg_commands.append(" ".join(command))
+        self.ffmpeg_commands.append(shlex.join(command))
 
     def add_warning(self, message: str):
         """Add warning message.
@@ -160,6 +270,7 @@ class ManifestBuilder:
             message: Warning message
         """
         self.data["warnings"].append(message)
+        self._stream_event("warning", {"message": message})
 
     def add_error(self, message: str):
         """Add error message.
@@ -168,6 +279,7 @@ class ManifestBuilder:
             message: Error message
         """
         self.data["errors"].append(message)
+        self._stream_event("error", {"message": message})
 
     def write(self, output_path: Path):
         """Write manifest to JSON file.
@@ -178,8 +290,20 @@ class ManifestBuilder:
         # Add all collected FFmpeg commands
         self.data["ffmpeg_commands"] = self.ffmpeg_commands
 
-        with open(output_path, "w", encoding="utf-8") as f:
-            json.dump(self.data, f, indent=2)
+        if orjson is not None:
+            output_path.write_bytes(orjson.dumps(self.data, option=orjson.OPT_INDENT_2))
+        else:
+            with open(output_path, "w", encoding="utf-8") as f:
+                json.dump(self.data, f, indent=2)
+
+        # The full manifest supersedes the crash-recovery sidecar
+        if self._stream is not None:
+            try:
+                self._stream.close()
+                (output_path.parent / "manifest.partial.jsonl").unlink(missing_ok=True)
+            except OSError:
+                pass
+            self._stream = None
 
     @staticmethod
     def _compute_sha256(file_path: Path) -> str:
@@ -191,11 +315,17 @@ class ManifestBuilder:
         Returns:
             SHA256 hash as hex string
         """
-        sha256_hash = hashlib.sha256()
-
         with open(file_path, "rb") as f:
-            # Read in chunks to handle large files
-            for byte_block in iter(lambda: f.read(4096), b""):
-                sha256_hash.update(byte_block)
-
-        return sha256_hash.hexdigest()
+            try:
+                # Python 3.11+: C-level read/update loop, bounded by
+                # OpenSSL/disk throughput instead of interpreter overhead
+                return hashlib.file_digest(f, "sha256").hexdigest()
+            except AttributeError:
+                # Python 3.10 fallback: 1 MiB readinto loop, no per-chunk
+                # bytes allocation
+                sha256_hash = hashlib.sha256()
+                buf = bytearray(1 << 20)
+                view = memoryview(buf)
+                while n := f.readinto(buf):
+                    sha256_hash.update(view[:n])
+                return sha256_hash.hexdigest()
@@ -2,12 +2,11 @@
 
 import logging
 import time
-from pathlib import Path
+from concurrent.futures import ThreadPoolExecutor
 
 from soundweave.config import PipelineConfig
-from soundweave.ffmpeg.commands import build_mp3_command
-from soundweave.ffmpeg.executor import ProcessingError, run_ffmpeg
-from soundweave.ffmpeg.probe import probe_loudnorm_duration
+from soundweave.ffmpeg.executor import ProcessingError
+from soundweave.ffmpeg.probe import probe_loudnorm_durations
 from soundweave.logging.logger import setup_logger
 from soundweave.logging.manifest import ManifestBuilder
 from soundweave.stages.ingest import ingest_stage
@@ -35,6 +34,11 @@ class Pipeline:
         self.logger = setup_logger(config.output_dir / "run_log.txt")
         self.manifest = ManifestBuilder(config)
 
+        # Concurrent video render in flight, tracked so the error path can
+        # clean it up (see _abort_video_render)
+        self._video_future = None
+        self._video_executor = None
+
     def run(self) -> int:
         """Run the complete pipeline.
 
@@ -57,7 +61,7 @@ class Pipeline:
             # Add to manifest
             self.manifest.add_input_tracks(
                 tracks,
-                order_source="order.txt" if (self.config.input_dir / "order.txt").exists() else "random_selection"
+                order_source="order.txt" if self.config.order_file else "random_selection"
             )
             self.manifest.add_input_asset("static_image", self.config.static_image)
             self.manifest.add_stage_result(
@@ -69,9 +73,11 @@ class Pipeline:
 
             self.logger.info("")
 
-            # Stage 2: Merge
+            # Stage 2: Merge (WAV + 320kbps MP3 in one ffmpeg pass)
             start_time = time.time()
-            merged_clean = merge_stage(tracks, self.config, self.logger)
+            merged_clean, merged_mp3, planned_duration_s = merge_stage(
+                tracks, self.config, self.logger
+            )
             merge_duration = time.time() - start_time
 
             self.manifest.add_output("merged_clean", merged_clean)
@@ -84,36 +90,49 @@ class Pipeline:
 
             self.logger.info("")
 
-            # Stage 3: MP3 Encoding & YouTube Timestamps
-            self.logger.info("=== Stage 3: MP3 Encoding & YouTube Timestamps ===")
-            start_time = time.time()
-
-            # Encode to MP3
-            merged_mp3 = self.config.output_dir / "merged.mp3"
-            mp3_cmd = build_mp3_command(merged_clean, merged_mp3)
-
-            self.logger.info("Encoding to MP3 (320kbps)...")
-            run_ffmpeg(
-                mp3_cmd,
-                self.logger,
-                description="MP3 encoding (320kbps CBR)",
-                timeout=None
-            )
+            # Stage 4 kickoff: the video render only needs merged_clean,
+            # which exists now, so it runs concurrently with the per-track
+            # timestamp measurement below — total cost becomes max() of the
+            # two instead of their sum. Results are collected after stage 3.
+            video_future = None
+            video_start = None
+            video_executor = None
+            if self.config.static_image:
+                video_executor = ThreadPoolExecutor(max_workers=1)
+                video_start = time.time()
+                # Mux from the MP3 so its audio is stream-copied into the
+                # MP4 instead of being AAC-encoded a second time
+                video_future = video_executor.submit(
+                    video_stage, merged_mp3, self.config, self.logger,
+                    planned_duration_s
+                )
+                self._video_future = video_future
+                self._video_executor = video_executor
 
-            mp3_size_mb = merged_mp3.stat().st_size / (1024 ** 2)
-            self.logger.info(f"  ✓ {merged_mp3.name} ({mp3_size_mb:.1f}MB)")
+            # Stage 3: YouTube Timestamps (MP3 already encoded during merge)
+            self.logger.info("=== Stage 3: YouTube Timestamps ===")
+            start_time = time.time()
 
             # Measure actual post-loudnorm durations for accurate timestamps
             crossfade_s = self.config.fade_ms / 1000.0
             timestamps_path = self.config.output_dir / "youtube_description.txt"
 
             self.logger.info("Measuring actual track durations (post-loudnorm)...")
+            # Each measurement is an independent single-threaded decode, so
+            # they run fanned out across cores instead of back to back
+            measurements = probe_loudnorm_durations([t.path for t in tracks])
+
             actual_timestamps = [0.0]  # First track starts at 0
             current_time = 0.0
+            last_duration = tracks[-1].duration_s  # refined by the loop below
 
-            for i, track in enumerate(tracks):
-                try:
-                    actual_duration = probe_loudnorm_duration(track.path)
+            for i, (track, measured) in enumerate(zip(tracks, measurements)):
+                if isinstance(measured, Exception):
+                    self.logger.warning(f"  Failed to measure {track.filename}: {measured}")
+                    # Fall back to original duration for this track
+                    actual_duration = track.duration_s
+                else:
+                    actual_duration = measured
                     diff = actual_duration - track.duration_s
                     self.logger.info(
                         f"  [{i+1}] {track.filename}: "
@@ -121,17 +140,12 @@ class Pipeline:
                         f"({'+' if diff >= 0 else ''}{diff:.2f}s)"
                     )
 
-                    if i < len(tracks) - 1:
-                        # Calculate next track start time
-                        current_time += actual_duration - crossfade_s
-                        actual_timestamps.append(current_time)
-
-                except Exception as e:
-                    self.logger.warning(f"  Failed to measure {track.filename}: {e}")
-                    # Fall back to original duration for this track
-                    if i < len(tracks) - 1:
-                        current_time += track.duration_s - crossfade_s
-                        actual_timestamps.append(current_time)
+                if i < len(tracks) - 1:
+                    # Calculate next track start time
+                    current_time += actual_duration - crossfade_s
+                    actual_timestamps.append(current_time)
+                else:
+                    last_duration = actual_duration
 
             # Generate YouTube timestamps
             self.logger.info("Generating YouTube timestamps...")
@@ -146,30 +160,44 @@ class Pipeline:
 
             encoding_duration = time.time() - start_time
 
-            self.manifest.add_output("merged_wav", merged_clean)
-            self.manifest.add_output("merged_mp3", merged_mp3)
-            self.manifest.add_output("youtube_description", timestamps_path)
+            # Mix duration follows from the measured timestamps, so the
+            # manifest doesn't need to re-probe the merged outputs
+            mix_duration_s = actual_timestamps[-1] + last_duration
+            self.manifest.add_outputs(
+                {
+                    "merged_wav": merged_clean,
+                    "merged_mp3": merged_mp3,
+                    "youtube_description": timestamps_path,
+                },
+                durations={
+                    "merged_wav": mix_duration_s,
+                    "merged_mp3": mix_duration_s,
+                }
+            )
             self.manifest.add_stage_result(
                 "encoding",
                 "success",
                 encoding_duration
             )
 
-            final_audio = merged_clean
-
             self.logger.info("")
 
-            # Stage 4: Video (optional)
-            if self.config.static_image:
-                start_time = time.time()
-                final_video = video_stage(final_audio, self.config, self.logger)
-                video_duration = time.time() - start_time
+            # Stage 4: Video (optional) — collect the render started above
+            if video_future is not None:
+                try:
+                    final_video = video_future.result()
+                finally:
+                    self._video_future = self._video_executor = None
+                    video_executor.shutdown(wait=False)
+                video_duration = time.time() - video_start
 
                 if final_video:
-                    self.manifest.add_output("final_video", final_video)
                     thumbnail_ext = self.config.static_image.suffix
                     thumbnail_path = self.config.output_dir / f"thumbnail{thumbnail_ext}"
-                    self.manifest.add_output("thumbnail", thumbnail_path)
+                    self.manifest.add_outputs({
+                        "final_video": final_video,
+                        "thumbnail": thumbnail_path,
+                    })
 
                 self.manifest.add_stage_result(
                     "video",
@@ -201,8 +229,8 @@ class Pipeline:
             self.logger.info("")
             self.logger.info("Outputs:")
             for name, data in self.manifest.data["outputs"].items():
-                path = Path(data["path"])
-                self.logger.info(f"  ✓ {path.name} ({data['file_size_mb']}MB)")
+                # filename/size were stored at add time; no re-stat needed
+                self.logger.info(f"  ✓ {data['filename']} ({data['file_size_mb']}MB)")
 
             return 0
 
@@ -232,6 +260,37 @@ class Pipeline:
             traceback.print_exc()
             return 2
 
+        finally:
+            self._abort_video_render()
+
+    def _abort_video_render(self):
+        """Stop a still-uncollected concurrent video render (error path).
+
+        Without this, a stage-3 failure would orphan the render: the
+        executor's non-daemon thread keeps encoding for hours, blocks
+        interpreter exit, and drops a final_video.mp4 into an output
+        directory whose run already reported failure. A queued render is
+        cancelled outright; a running one is drained (the blocking ffmpeg
+        call can't be interrupted from here) and its output removed.
+        No-op once stage 4 has collected the result.
+        """
+        future = self._video_future
+        executor = self._video_executor
+        self._video_future = self._video_executor = None
+        if future is None:
+            return
+
+        if not future.cancel():
+            self.logger.warning("Waiting for the in-flight video render before aborting...")
+            try:
+                final_video = future.result()
+            except Exception:
+                final_video = None  # Render failed too; nothing to remove
+            if final_video:
+                final_video.unlink(missing_ok=True)
+
+        executor.shutdown(wait=False)
+
     def _write_manifest_on_error(self):
         """Write manifest even on error (for debugging)."""
         try:
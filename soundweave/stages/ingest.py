@@ -1,17 +1,22 @@
 """Stage 1: Ingest - File discovery and ordering."""
 
 import logging
-from dataclasses import dataclass
+import os
+import random
+from collections import Counter
+from collections.abc import Set as AbstractSet
+from dataclasses import dataclass, field
 from pathlib import Path
 
 from soundweave.config import PipelineConfig
-from soundweave.ffmpeg.probe import probe_audio_file
+from soundweave.ffmpeg.probe import probe_audio_files
 from soundweave.utils.natural_sort import natural_sort
 from soundweave.utils.validators import ValidationError
 
 
-# Supported audio file extensions
-AUDIO_EXTENSIONS = {".mp3", ".wav", ".m4a", ".flac", ".mpeg"}
+# Supported audio file extensions (lowercase; discovery lowercases the
+# suffix before the membership test). Frozen: shared constant, never mutated.
+AUDIO_EXTENSIONS: frozenset[str] = frozenset({".mp3", ".wav", ".m4a", ".flac", ".mpeg"})
 
 
 @dataclass
@@ -25,25 +30,36 @@ class AudioTrack:
     channels: int
     codec: str
 
+    # str(path), cached once so command builders don't re-walk the Path
+    path_str: str = field(init=False)
 
-def discover_audio_files(input_dir: Path) -> list[Path]:
+    def __post_init__(self):
+        self.path_str = str(self.path)
+
+
+def discover_audio_files(input_dir: Path) -> dict[str, Path]:
     """Scan input directory for audio files (top-level only).
 
     Args:
         input_dir: Directory to scan
 
     Returns:
-        List of audio file paths
+        Mapping of filename to file path, in directory order
 
     Raises:
         ValidationError: If no audio files found
     """
-    audio_files = []
-
-    for ext in AUDIO_EXTENSIONS:
-        for file_path in input_dir.glob(f"*{ext}"):
-            if file_path.is_file():
-                audio_files.append(file_path)
+    # One readdir pass instead of a glob per extension; is_file comes from
+    # the dirent type on Linux/macOS, so the common case needs no stat.
+    # Built as the name→path map directly, since that's what ordering and
+    # probing both consume.
+    with os.scandir(input_dir) as entries:
+        audio_files = {
+            entry.name: Path(entry.path)
+            for entry in entries
+            if entry.is_file(follow_symlinks=False)
+            and os.path.splitext(entry.name)[1].lower() in AUDIO_EXTENSIONS
+        }
 
     if not audio_files:
         raise ValidationError(
@@ -102,14 +118,14 @@ def parse_order_file(order_file: Path) -> list[str]:
 
 def validate_ordering(
     ordered_filenames: list[str],
-    available_files: set[str],
+    available_files: AbstractSet[str],
     logger: logging.Logger
 ) -> None:
     """Validate that order.txt lists only files that exist in input directory.
 
     Args:
         ordered_filenames: Filenames from order.txt (may have duplicates)
-        available_files: Set of actual filenames in input directory
+        available_files: Actual filenames in input directory (set or keys view)
         logger: Logger for warnings
 
     Raises:
@@ -120,28 +136,37 @@ def validate_ordering(
         - Files in input dir but not in order.txt → OK (just won't be included)
         - Duplicates allowed (same file processed multiple times)
     """
-    # Get unique filenames from order.txt (to check coverage)
-    unique_ordered = set(ordered_filenames)
+    # One pass: dedupe and collect names missing from the input directory
+    # at the same time, instead of building a set and then two set-diffs
+    unique_ordered = set()
+    extra_in_order = []
+    for filename in ordered_filenames:
+        if filename not in unique_ordered:
+            unique_ordered.add(filename)
+            if filename not in available_files:
+                extra_in_order.append(filename)
 
-    # Check for files in order.txt but not in input directory (ERROR)
-    extra_in_order = unique_ordered - available_files
+    # Files in order.txt but not in input directory (ERROR)
     if extra_in_order:
         raise ValidationError(
             f"order.txt lists files not found in input directory: "
             f"{', '.join(sorted(extra_in_order))}"
         )
 
-    # Check for files in input directory but not in order.txt (just log info)
-    missing_from_order = available_files - unique_ordered
-    if missing_from_order:
+    # Files in input directory but not in order.txt (just log info). Past
+    # the check above unique_ordered is a subset of available_files, so
+    # the count falls out of the set sizes.
+    missing_count = len(available_files) - len(unique_ordered)
+    if missing_count:
         logger.info(
-            f"Note: {len(missing_from_order)} file(s) in input directory not listed in order.txt (will be skipped)"
+            f"Note: {missing_count} file(s) in input directory not listed in order.txt (will be skipped)"
         )
 
-    # Log duplicates (allowed, but worth noting)
+    # Log duplicates (allowed, but worth noting). One Counter pass instead
+    # of list.count per element, which was quadratic in the line count.
     if len(ordered_filenames) != len(unique_ordered):
-        duplicates = [f for f in ordered_filenames if ordered_filenames.count(f) > 1]
-        unique_dupes = set(duplicates)
+        counts = Counter(ordered_filenames)
+        unique_dupes = {f for f, c in counts.items() if c > 1}
         logger.info(
             f"order.txt contains duplicates (will be processed multiple times): "
             f"{', '.join(sorted(unique_dupes))}"
@@ -149,15 +174,16 @@ def validate_ordering(
 
 
 def determine_track_order(
-    input_dir: Path,
-    audio_files: list[Path],
+    order_file: Path | None,
+    file_map: dict[str, Path],
     logger: logging.Logger
 ) -> list[str]:
     """Determine playback order for audio files.
 
     Args:
-        input_dir: Input directory
-        audio_files: List of discovered audio files
+        order_file: Path to order.txt, or None when the input directory
+            has none (resolved once by PipelineConfig)
+        file_map: Filename → path mapping from discovery
         logger: Logger for info/warnings
 
     Returns:
@@ -167,10 +193,9 @@ def determine_track_order(
         1. If order.txt exists: use it (and validate)
         2. Otherwise: natural sort by filename
     """
-    order_file = input_dir / "order.txt"
-    available_filenames = {f.name for f in audio_files}
+    available_filenames = file_map.keys()
 
-    if order_file.exists():
+    if order_file is not None:
         logger.info(f"Using order.txt for track ordering")
         ordered_filenames = parse_order_file(order_file)
         validate_ordering(ordered_filenames, available_filenames, logger)
@@ -180,31 +205,6 @@ def determine_track_order(
         return natural_sort(list(available_filenames))
 
 
-def probe_track(file_path: Path, logger: logging.Logger) -> AudioTrack | None:
-    """Probe a single audio file and create AudioTrack.
-
-    Args:
-        file_path: Path to audio file
-        logger: Logger for warnings
-
-    Returns:
-        AudioTrack if successful, None if file is corrupted
-    """
-    try:
-        metadata = probe_audio_file(file_path)
-        return AudioTrack(
-            path=file_path,
-            filename=file_path.name,
-            duration_s=metadata.duration_s,
-            sample_rate=metadata.sample_rate,
-            channels=metadata.channels,
-            codec=metadata.codec
-        )
-    except ValidationError as e:
-        logger.warning(f"Skipping corrupted file {file_path.name}: {e}")
-        return None
-
-
 def ingest_stage(config: PipelineConfig, logger: logging.Logger) -> list[AudioTrack]:
     """Stage 1: Discover and order audio files.
 
@@ -227,47 +227,60 @@ def ingest_stage(config: PipelineConfig, logger: logging.Logger) -> list[AudioTr
         6. Filter out corrupted files (with warnings)
         7. Return ordered list
     """
-    import random
-
     logger.info("=== Stage 1: Ingest ===")
     logger.info(f"Scanning {config.input_dir} for audio files...")
 
-    # Discover audio files
-    audio_files = discover_audio_files(config.input_dir)
-    logger.info(f"Found {len(audio_files)} audio file(s)")
+    # Discover audio files (filename → path, built in the scan itself)
+    file_map = discover_audio_files(config.input_dir)
+    logger.info(f"Found {len(file_map)} audio file(s)")
 
     # Determine order
-    ordered_filenames = determine_track_order(config.input_dir, audio_files, logger)
+    ordered_filenames = determine_track_order(config.order_file, file_map, logger)
     logger.info(f"Track order determined: {len(ordered_filenames)} track(s) available")
 
-    # Apply shuffle if enabled
-    if config.shuffle:
+    # Apply shuffle and num_tracks limit
+    limit = config.num_tracks
+    if limit is not None and limit < len(ordered_filenames):
+        if config.shuffle:
+            # random.sample(k of n) draws the same distribution as
+            # shuffle-then-slice but only does O(k) work instead of
+            # permuting the whole list
+            logger.info(f"Selecting {limit} random track(s) from {len(ordered_filenames)} available")
+            ordered_filenames = random.sample(ordered_filenames, limit)
+        else:
+            logger.info(f"Selecting first {limit} track(s) from {len(ordered_filenames)} available")
+            ordered_filenames = ordered_filenames[:limit]
+        logger.info(f"Selected {len(ordered_filenames)} track(s) for processing")
+    elif config.shuffle:
         logger.info("Shuffling track order")
         random.shuffle(ordered_filenames)
 
-    # Limit to num_tracks if specified
-    if config.num_tracks is not None and config.num_tracks < len(ordered_filenames):
-        logger.info(f"Selecting first {config.num_tracks} track(s) from {len(ordered_filenames)} available")
-        ordered_filenames = ordered_filenames[:config.num_tracks]
-        logger.info(f"Selected {len(ordered_filenames)} track(s) for processing")
-
-    # Build filename → path mapping
-    file_map = {f.name: f for f in audio_files}
+    # Probe tracks concurrently (ffprobe spawn latency dominates, so the
+    # thread pool collapses N serial spawns into overlapping ones)
+    ordered_paths = [file_map[filename] for filename in ordered_filenames]
+    logger.debug(f"Probing {len(ordered_paths)} track(s)...")
+    probe_results = probe_audio_files(ordered_paths)
 
-    # Probe each track in order
     tracks = []
-    for filename in ordered_filenames:
-        file_path = file_map[filename]
-        logger.debug(f"Probing {filename}...")
-
-        track = probe_track(file_path, logger)
-        if track:
-            tracks.append(track)
-            logger.info(
-                f"  [{len(tracks)}] {track.filename}: "
-                f"{track.duration_s:.1f}s, {track.sample_rate}Hz, "
-                f"{track.channels}ch, {track.codec}"
-            )
+    for file_path, result in zip(ordered_paths, probe_results):
+        if isinstance(result, ValidationError):
+            logger.warning(f"Skipping corrupted file {file_path.name}: {result}")
+            continue
+
+        track = AudioTrack(
+            path=file_path,
+            filename=file_path.name,
+            duration_s=result.duration_s,
+            sample_rate=result.sample_rate,
+            channels=result.channels,
+            codec=result.codec
+        )
+        tracks.append(track)
+        logger.info(
+            f"  [{len(tracks)}] {track.filename}: "
+            f"{track.duration_s:.1f}s, {track.sample_rate}Hz, "
+            f"{track.channels}ch, {track.codec}"
+        )
 
     # Verify we have at least one valid track
     if not tracks:
@@ -1,12 +1,17 @@
 """Stage 2: Merge - Crossfade merging of audio tracks."""
 
 import logging
+import os
+import shutil
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 from soundweave.config import PipelineConfig
-from soundweave.ffmpeg.commands import build_merge_command
+from soundweave.ffmpeg.commands import build_merge_command, build_mp3_command
 from soundweave.ffmpeg.executor import run_ffmpeg
 from soundweave.stages.ingest import AudioTrack
+from soundweave.utils.fs import file_mb
+from soundweave.utils.loudnorm_cache import measured_loudnorm_values
 
 
 def calculate_crossfade_durations(
@@ -29,41 +34,89 @@ def calculate_crossfade_durations(
         - If track duration < crossfade: reduce to 50% of track duration
         - Minimum effective crossfade: 1 second
     """
-    if len(tracks) <= 1:
+    n = len(tracks)
+    if n <= 1:
         return []
 
-    crossfades = []
-
-    for i in range(len(tracks) - 1):
-        track1 = tracks[i]
-        track2 = tracks[i + 1]
+    # Hoist the attribute walks out of the pair loop; the common case
+    # (every track longer than the crossfade) then touches plain floats only
+    durations = [t.duration_s for t in tracks]
+    crossfades = [default_crossfade_s] * (n - 1)
 
+    for i in range(n - 1):
         # Find the shorter of the two tracks
-        min_duration = min(track1.duration_s, track2.duration_s)
+        min_duration = min(durations[i], durations[i + 1])
 
-        # Calculate crossfade duration
         if min_duration < default_crossfade_s:
             # Reduce to 50% of shorter track duration
             crossfade_s = max(1.0, min_duration * 0.5)
+            short = tracks[i] if durations[i] < durations[i + 1] else tracks[i + 1]
             logger.warning(
-                f"Track '{track1.filename if track1.duration_s < track2.duration_s else track2.filename}' "
+                f"Track '{short.filename}' "
                 f"duration ({min_duration:.1f}s) < crossfade ({default_crossfade_s:.1f}s), "
                 f"reduced to {crossfade_s:.1f}s"
             )
-        else:
-            crossfade_s = default_crossfade_s
-
-        crossfades.append(crossfade_s)
+            crossfades[i] = crossfade_s
 
     return crossfades
 
 
+def _single_track_fastpath(track: AudioTrack, output_path: Path) -> bool:
+    """Hardlink a lone track into place when it already matches the target format.
+
+    A single 48kHz/16-bit stereo WAV input needs no resample, and skipping
+    loudnorm avoids a full decode+encode pass. Falls back to a plain copy
+    when the output directory is on a different filesystem.
+
+    Args:
+        track: The only track in the run (metadata from ingest probing)
+        output_path: Path for merged_clean.wav
+
+    Returns:
+        True if the fast path was taken
+    """
+    if track.codec != "pcm_s16le" or track.sample_rate != 48000 or track.channels != 2:
+        return False
+
+    output_path.unlink(missing_ok=True)
+    try:
+        os.link(track.path, output_path)
+    except OSError:
+        shutil.copyfile(track.path, output_path)
+    return True
+
+
+def _encode_mp3(
+    input_path: Path,
+    mp3_path: Path,
+    logger: logging.Logger
+) -> None:
+    """Encode a WAV to 320kbps CBR MP3 in one gapless pass.
+
+    A segmented parallel encode was tried here and reverted: libmp3lame
+    inserts its own encoder delay and end padding into every segment, so
+    stream-copy concatenation produced an audible glitch at each chunk
+    boundary. One single-threaded encode keeps the output gapless.
+
+    Args:
+        input_path: Path to source WAV
+        mp3_path: Path for output MP3
+        logger: Logger instance
+    """
+    run_ffmpeg(
+        build_mp3_command(input_path, mp3_path),
+        logger,
+        description="MP3 encoding (320kbps CBR)",
+        timeout=None
+    )
+
+
 def merge_stage(
     tracks: list[AudioTrack],
     config: PipelineConfig,
     logger: logging.Logger
-) -> Path:
-    """Stage 2: Merge tracks with crossfades into a single file.
+) -> tuple[Path, Path, float]:
+    """Stage 2: Merge tracks with crossfades into WAV + MP3 in one pass.
 
     Args:
         tracks: Ordered list of audio tracks
@@ -71,16 +124,20 @@ def merge_stage(
         logger: Logger instance
 
     Returns:
-        Path to merged_clean.wav
+        (Path to merged_clean.wav, Path to merged.mp3, planned mix duration
+        in seconds — track durations minus crossfade overlap — so callers
+        that only need the length don't have to re-probe the output)
 
     Process:
         1. Calculate crossfade durations (handle short tracks)
-        2. Build FFmpeg filter_complex for sequential crossfades
+        2. Build FFmpeg filter_complex for the crossfade tree, fanned out
+           to both outputs so the mix is decoded/filtered exactly once
         3. Execute FFmpeg command
-        4. Verify output exists
+        4. Verify outputs exist
 
     Output format:
-        - 48kHz, 16-bit PCM, stereo
+        - WAV: 48kHz, 16-bit PCM, stereo
+        - MP3: 320kbps CBR
         - No gaps or hard cuts between tracks
     """
     logger.info("=== Stage 2: Merge ===")
@@ -96,26 +153,61 @@ def merge_stage(
             f"min={min(crossfades):.1f}s, max={max(crossfades):.1f}s, avg={sum(crossfades)/len(crossfades):.1f}s"
         )
 
-    # Build output path
+    # Build output paths
     output_path = config.output_dir / "merged_clean.wav"
+    mp3_path = config.output_dir / "merged.mp3"
+
+    if (
+        len(tracks) == 1
+        and config.skip_loudnorm_if_clean
+        and _single_track_fastpath(tracks[0], output_path)
+    ):
+        # WAV is hardlinked into place; only the MP3 encode remains
+        logger.info(
+            f"Single track already 48kHz/16-bit stereo: linked {output_path.name}, "
+            f"skipping loudnorm"
+        )
+        _encode_mp3(tracks[0].path, mp3_path, logger)
+    else:
+        # Gain-alignment measurements come from the on-disk cache; each miss
+        # costs a full decode, so they run fanned out across cores like the
+        # stage-3 duration probes (cache hits return immediately either way)
+        workers = min(len(tracks), max(1, (os.cpu_count() or 2) // 2))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            measured = tuple(
+                executor.map(lambda t: measured_loudnorm_values(t.path, logger), tracks)
+            )
+        n_measured = sum(1 for m in measured if m is not None)
+        logger.info(f"Loudness measurements available for {n_measured}/{len(tracks)} track(s)")
 
-    # Build FFmpeg command
-    command = build_merge_command(tracks, output_path, crossfades)
+        # Build FFmpeg command (WAV + MP3 from one filter graph)
+        command = build_merge_command(
+            tracks, output_path, crossfades, output_mp3=mp3_path, measured=measured
+        )
 
-    # Execute
-    run_ffmpeg(
-        command,
-        logger,
-        description=f"Merging {len(tracks)} tracks with crossfades",
-        timeout=None  # No timeout for long merges
-    )
+        # Execute (the builder may have spilled the filter graph to a
+        # script file for very large playlists; clean it up afterwards)
+        try:
+            run_ffmpeg(
+                command,
+                logger,
+                description=f"Merging {len(tracks)} tracks with crossfades (WAV + 320kbps MP3)",
+                timeout=None  # No timeout for long merges
+            )
+        finally:
+            output_path.with_name("_filter_complex.txt").unlink(missing_ok=True)
 
-    # Verify output
-    if not output_path.exists():
+    # Verify outputs
+    if not output_path.exists() or not mp3_path.exists():
         from soundweave.ffmpeg.executor import ProcessingError
         raise ProcessingError("merge: Output file not created")
 
-    file_size_mb = output_path.stat().st_size / (1024 ** 2)
-    logger.info(f"Merge complete: {output_path.name} ({file_size_mb:.1f}MB)")
+    file_size_mb = file_mb(output_path)
+    mp3_size_mb = file_mb(mp3_path)
+    logger.info(
+        f"Merge complete: {output_path.name} ({file_size_mb:.1f}MB), "
+        f"{mp3_path.name} ({mp3_size_mb:.1f}MB)"
+    )
 
-    return output_path
+    planned_duration_s = sum(t.duration_s for t in tracks) - sum(crossfades)
+    return output_path, mp3_path, planned_duration_s
@@ -1,26 +1,32 @@
 """Stage 4: Video - Render static video with cover image and audio."""
 
 import logging
+import os
 import shutil
 from pathlib import Path
 
 from soundweave.config import PipelineConfig
-from soundweave.ffmpeg.commands import build_video_command
+from soundweave.ffmpeg.commands import build_still_frame_command, build_video_mux_command
 from soundweave.ffmpeg.executor import run_ffmpeg
 from soundweave.ffmpeg.probe import probe_audio_file
+from soundweave.utils.fs import file_mb
 
 
 def video_stage(
     audio_path: Path,
     config: PipelineConfig,
-    logger: logging.Logger
+    logger: logging.Logger,
+    duration_s: float | None = None
 ) -> Path:
     """Stage 4: Render static video with static image.
 
     Args:
-        audio_path: Path to final audio (merged.wav)
+        audio_path: Path to final audio (merged.mp3 preferred, so the mux
+            can stream-copy it; merged.wav gets an AAC encode)
         config: Pipeline configuration
         logger: Logger instance
+        duration_s: Audio duration if the caller already knows it; probed
+            from the file otherwise
 
     Returns:
         Path to final_video.mp4
@@ -28,10 +34,11 @@ def video_stage(
     Process:
         1. Probe audio duration
         2. Scale/pad static image to 1920x1080 (preserve aspect, letterbox)
-        3. Render static video:
+           and encode it once as a single H.264 keyframe
+        3. Mux the looped keyframe with the audio via stream copy:
            - 1fps (minimal file size)
            - H.264 (yuv420p, high profile)
-           - AAC audio (192kbps)
+           - Stream-copied MP3 audio (AAC 192kbps for WAV input)
         4. Copy static image to output/thumbnail.{png,jpg}
 
     Output format:
@@ -47,33 +54,39 @@ def video_stage(
 
     logger.info(f"Static image: {config.static_image.name}")
 
-    # Probe audio to get duration
-    logger.info("Probing audio duration...")
-    audio_metadata = probe_audio_file(audio_path)
-    duration_s = audio_metadata.duration_s
+    # Probe audio to get duration, unless the pipeline already knows it
+    if duration_s is None:
+        logger.info("Probing audio duration...")
+        audio_metadata = probe_audio_file(audio_path)
+        duration_s = audio_metadata.duration_s
     logger.info(f"Audio duration: {duration_s:.2f}s")
 
-    # Build output path
+    # Build output paths
     output_path = config.output_dir / "final_video.mp4"
-
-    # Build FFmpeg command
-    command = build_video_command(
-        audio_path,
-        config.static_image,
-        output_path,
-        duration_s
-    )
-
-    # Execute
-    logger.info("Rendering video (this may take a while for long audio)...")
-    run_ffmpeg(
-        command,
-        logger,
-        description="Video rendering with static image",
-        timeout=None
-    )
-
-    video_size_mb = output_path.stat().st_size / (1024 ** 2)
+    keyframe_path = config.output_dir / "_keyframe.mp4"
+
+    # Step 1: Encode the scaled/padded cover exactly once as a keyframe.
+    # Step 2: Loop that frame over the audio with -c:v copy, so the encode
+    # cost is one frame regardless of audio length.
+    try:
+        run_ffmpeg(
+            build_still_frame_command(config.static_image, keyframe_path),
+            logger,
+            description="Encoding cover image as single keyframe",
+            timeout=60
+        )
+
+        logger.info("Muxing looped keyframe with audio...")
+        run_ffmpeg(
+            build_video_mux_command(keyframe_path, audio_path, output_path, duration_s),
+            logger,
+            description="Video mux with static image",
+            timeout=None
+        )
+    finally:
+        keyframe_path.unlink(missing_ok=True)
+
+    video_size_mb = file_mb(output_path)
     logger.info(f"  ✓ {output_path.name} ({video_size_mb:.1f}MB)")
 
     # Copy static image to output as thumbnail
@@ -81,7 +94,13 @@ def video_stage(
     thumbnail_path = config.output_dir / f"thumbnail{thumbnail_ext}"
 
     logger.info(f"Copying static image to {thumbnail_path.name}...")
-    shutil.copy2(config.static_image, thumbnail_path)
+    # Hard link instead of copying the image bytes; fall back to a real
+    # copy when the output directory is on a different filesystem
+    thumbnail_path.unlink(missing_ok=True)
+    try:
+        os.link(config.static_image, thumbnail_path)
+    except OSError:
+        shutil.copy2(config.static_image, thumbnail_path)
 
     logger.info("Video rendering complete")
 
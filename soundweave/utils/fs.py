@@ -0,0 +1,47 @@
+"""Small filesystem helpers shared across stages."""
+
+import json
+import os
+import tempfile
+from pathlib import Path
+
+_MB = 1 << 20
+
+
+def cache_disabled() -> bool:
+    """True when SOUNDWEAVE_NO_CACHE=1 turns the on-disk caches off."""
+    return os.environ.get("SOUNDWEAVE_NO_CACHE") == "1"
+
+
+def write_json_atomic(path: Path, data: dict) -> None:
+    """Best-effort atomic JSON write for the on-disk caches.
+
+    Writes to a tempfile in the destination directory (created if needed)
+    and os.replace()s it into place, so a concurrent run never sees a
+    partial file. OSError is swallowed: every caller is a cache, and a
+    missed write just means the next run recomputes.
+
+    Args:
+        path: Destination JSON file
+        data: JSON-serializable payload
+    """
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=path.parent)
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            json.dump(data, f)
+        os.replace(tmp_path, path)
+    except OSError:
+        pass
+
+
+def file_mb(path: Path) -> float:
+    """Return a file's size in mebibytes (single stat call).
+
+    Args:
+        path: File to measure
+
+    Returns:
+        Size in MiB
+    """
+    return os.stat(path).st_size / _MB
@@ -0,0 +1,119 @@
+"""Cached per-track loudness measurement.
+
+The merge graph level-matches tracks before crossfading with a plain
+volume gain derived from each track's measured integrated loudness,
+leaving the one expensive loudnorm pass for the merged stream. Measuring
+costs one full decode per track, so the results are cached in
+~/.cache/soundweave/loudnorm/ keyed by the file's mtime and size —
+re-runs over the same library skip the analysis pass.
+"""
+
+import hashlib
+import json
+import logging
+import os
+import re
+import subprocess
+from pathlib import Path
+
+from soundweave.utils.fs import cache_disabled, write_json_atomic
+
+_CACHE_DIR = Path.home() / ".cache" / "soundweave" / "loudnorm"
+
+# loudnorm prints its analysis as a JSON block at the end of stderr
+_JSON_BLOCK_RE = re.compile(r"\{[^{}]+\}\s*$")
+
+# Keys from the loudnorm JSON report. The command builders currently read
+# only input_i (for the gain alignment); the full report is cached so a
+# future two-pass linear loudnorm could reuse it without re-measuring.
+_REPORT_KEYS = ("input_i", "input_tp", "input_lra", "input_thresh", "target_offset")
+
+
+def _cache_path(file_path: Path) -> Path:
+    """Cache file location for a given input path."""
+    digest = hashlib.sha1(str(file_path.resolve()).encode("utf-8")).hexdigest()
+    return _CACHE_DIR / f"{digest}.json"
+
+
+def measured_loudnorm_values(
+    file_path: Path,
+    logger: logging.Logger | None = None
+) -> tuple[str, str, str, str, str] | None:
+    """Return cached (or freshly measured) loudnorm analysis for a file.
+
+    Args:
+        file_path: Path to audio file
+        logger: Optional logger for measurement progress
+
+    Returns:
+        (measured_I, measured_TP, measured_LRA, measured_thresh, offset)
+        as strings; measured_I drives the per-track gain alignment in the
+        merge graph. None if measurement failed — those tracks get the
+        silence trim only, and the merged-stream loudnorm still runs.
+    """
+    try:
+        stat = os.stat(file_path)
+    except OSError:
+        return None
+
+    cache_file = _cache_path(file_path)
+
+    if not cache_disabled():
+        try:
+            cached = json.loads(cache_file.read_text(encoding="utf-8"))
+            if cached.get("mtime_ns") == stat.st_mtime_ns and cached.get("size") == stat.st_size:
+                return tuple(cached["values"])
+        except (OSError, ValueError, KeyError):
+            pass  # Missing/corrupt cache: fall through to measurement
+
+    values = _measure(file_path, logger)
+    if values is None:
+        return None
+
+    write_json_atomic(
+        cache_file,
+        {"mtime_ns": stat.st_mtime_ns, "size": stat.st_size, "values": list(values)}
+    )
+
+    return values
+
+
+def _measure(
+    file_path: Path,
+    logger: logging.Logger | None
+) -> tuple[str, str, str, str, str] | None:
+    """Run the loudnorm analysis pass and parse its JSON report."""
+    # Import here to avoid making this module's import depend on the
+    # command-builder stack when only cache hits are needed.
+    from soundweave.ffmpeg.commands import NORMALIZE_FILTER, THREAD_FLAGS
+
+    if logger:
+        logger.debug(f"Measuring loudness of {file_path.name}...")
+
+    try:
+        result = subprocess.run(
+            [
+                "ffmpeg", *THREAD_FLAGS, "-hide_banner",
+                "-i", str(file_path),
+                "-af", NORMALIZE_FILTER + ":print_format=json",
+                "-f", "null", "-"
+            ],
+            capture_output=True,
+            text=True,
+            timeout=300
+        )
+    except (OSError, subprocess.TimeoutExpired):
+        return None
+
+    if result.returncode != 0:
+        return None
+
+    match = _JSON_BLOCK_RE.search(result.stderr.strip())
+    if not match:
+        return None
+
+    try:
+        report = json.loads(match.group(0))
+        return tuple(str(report[key]) for key in _REPORT_KEYS)
+    except (ValueError, KeyError):
+        return None
@@ -3,6 +3,10 @@
 import re
 from typing import Any
 
+# Compiled once; the bound .split skips the per-call pattern-cache probe
+# that re.split pays. The capture group keeps the digit runs in the output.
+_split = re.compile(r"(\d+)").split
+
 
 def natural_sort_key(text: str) -> list[Any]:
     """Generate a sort key for natural (human-friendly) sorting.
@@ -20,11 +24,13 @@ def natural_sort_key(text: str) -> list[Any]:
         >>> sorted(files, key=natural_sort_key)
         ['track1.mp3', 'track2.mp3', 'track10.mp3']
     """
-    def convert(fragment: str) -> int | str:
-        """Convert fragment to int if numeric, otherwise lowercase string."""
-        return int(fragment) if fragment.isdigit() else fragment.lower()
-
-    return [convert(c) for c in re.split(r'(\d+)', text)]
+    # Split output alternates non-digit/digit fragments, so checking the
+    # first character classifies a fragment without scanning it. isdecimal
+    # (not isdigit) matches exactly what \d captures — isdigit is also true
+    # for characters like superscripts that int() rejects. The empty
+    # fragments are kept on purpose: they keep ints and strings at the
+    # same positions across keys, so list comparison never mixes types.
+    return [int(c) if c[:1].isdecimal() else c.lower() for c in _split(text)]
 
 
 def natural_sort(items: list[str]) -> list[str]:
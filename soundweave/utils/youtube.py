@@ -1,11 +1,18 @@
 """YouTube-related utilities for timestamps and track names."""
 
 import re
+from functools import lru_cache
 from pathlib import Path
 
 from soundweave.stages.ingest import AudioTrack
 
+# All trailing dotted extensions in one pass (".mp3.mpeg" included). The
+# lookbehind keeps dotfile-style names like ".hidden" intact, matching
+# Path.stem's behaviour.
+_EXT_RE = re.compile(r"(?<=[^/\\.])(?:\.[^./\\]+)+$")
 
+
+@lru_cache(maxsize=1024)
 def clean_track_name(filename: str) -> str:
     """Clean up track filename for YouTube display.
 
@@ -23,18 +30,10 @@ def clean_track_name(filename: str) -> str:
         >>> clean_track_name("My-Song.flac")
         'My-Song'
     """
-    # Remove file extensions (handle double extensions like .mp3.mpeg)
-    name = filename
-    while True:
-        new_name = Path(name).stem
-        if new_name == name:
-            break
-        name = new_name
-
-    # Replace underscores with spaces
-    name = name.replace("_", " ")
-
-    return name
+    # Remove file extensions (handle double extensions like .mp3.mpeg),
+    # then replace underscores with spaces. Memoized: both the timestamp
+    # generator and the description writer clean the same track list.
+    return _EXT_RE.sub("", filename).replace("_", " ")
 
 
 def format_timestamp(seconds: float) -> str:
@@ -65,68 +64,35 @@ def format_timestamp(seconds: float) -> str:
         return f"{minutes}:{secs:02d}"
 
 
-def generate_youtube_timestamps(
+def _iter_description_lines(
     tracks: list[AudioTrack],
-    crossfade_duration_s: float
-) -> list[tuple[float, str]]:
-    """Generate YouTube timestamps for a list of tracks.
-
-    Args:
-        tracks: List of audio tracks in playback order
-        crossfade_duration_s: Crossfade duration in seconds
+    crossfade_duration_s: float,
+    title: str,
+    actual_timestamps: list[float] | None
+):
+    """Yield description lines one at a time (title, then one per track).
 
-    Returns:
-        List of (timestamp_seconds, track_name) tuples
+    Single pass: timestamp arithmetic, name cleaning, and formatting all
+    happen per yielded line, with no intermediate (timestamp, name) list.
 
     Notes:
         - First track starts at 0:00
-        - Each subsequent track timestamp accounts for crossfade overlap
+        - Calculated timestamps account for crossfade overlap
         - Track names are cleaned (extensions removed, underscores → spaces)
     """
-    timestamps = []
-    current_time = 0.0
-
-    for i, track in enumerate(tracks):
-        # Clean the track name
-        clean_name = clean_track_name(track.filename)
+    yield f"{title}:"
 
-        # Add timestamp
-        timestamps.append((current_time, clean_name))
-
-        # Calculate next timestamp (subtract crossfade overlap)
-        if i < len(tracks) - 1:
+    if actual_timestamps:
+        for timestamp_s, track in zip(actual_timestamps, tracks):
+            yield f"{format_timestamp(timestamp_s)} {clean_track_name(track.filename)}"
+    else:
+        current_time = 0.0
+        for track in tracks:
+            yield f"{format_timestamp(current_time)} {clean_track_name(track.filename)}"
+            # Next calculated timestamp (subtract crossfade overlap); the
+            # value past the last track is simply never read
             current_time += track.duration_s - crossfade_duration_s
 
-    return timestamps
-
-
-def format_youtube_description(
-    timestamps: list[tuple[float, str]],
-    title: str = "Tracklist"
-) -> str:
-    """Format timestamps as YouTube description text.
-
-    Args:
-        timestamps: List of (timestamp_seconds, track_name) tuples
-        title: Optional title for the timestamp section
-
-    Returns:
-        Formatted description text ready for YouTube
-
-    Example output:
-        Tracklist:
-        0:00 BlueSky
-        2:41 CavaBien
-        4:49 FloralLife
-    """
-    lines = [f"{title}:"]
-
-    for timestamp_s, track_name in timestamps:
-        formatted_time = format_timestamp(timestamp_s)
-        lines.append(f"{formatted_time} {track_name}")
-
-    return "\n".join(lines)
-
 
 def write_youtube_description(
     output_path: Path,
@@ -144,19 +110,19 @@ def write_youtube_description(
         title: Optional title for the timestamp section
         actual_timestamps: Optional list of actual timestamps (from silence detection).
                           If provided, these are used instead of calculating from durations.
-    """
-    if actual_timestamps and len(actual_timestamps) == len(tracks):
-        # Use actual detected timestamps
-        timestamps = []
-        for i, track in enumerate(tracks):
-            clean_name = clean_track_name(track.filename)
-            timestamps.append((actual_timestamps[i], clean_name))
-    else:
-        # Fall back to calculated timestamps
-        timestamps = generate_youtube_timestamps(tracks, crossfade_duration_s)
 
-    description = format_youtube_description(timestamps, title)
+    Example output:
+        Tracklist:
+        0:00 BlueSky
+        2:41 CavaBien
+        4:49 FloralLife
+    """
+    if actual_timestamps and len(actual_timestamps) != len(tracks):
+        # Mismatched detection results: fall back to calculated timestamps
+        actual_timestamps = None
 
     with open(output_path, "w", encoding="utf-8") as f:
-        f.write(description)
+        f.write("\n".join(_iter_description_lines(
+            tracks, crossfade_duration_s, title, actual_timestamps
+        )))
         f.write("\n")  # Ensure file ends with newline